@@ -5,12 +5,103 @@ High-fidelity human movement simulation using Bezier curves and Gaussian noise.
 Implements Fitts's Law for natural acceleration/deceleration patterns.
 """
 
-import math
-import random
 import asyncio
-from typing import List, Tuple
+import functools
+import os
+from typing import Sequence, Tuple
+
+import numpy as np
 from playwright.async_api import Page
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Shared generator for bulk noise draws (avoids per-call seeding overhead)
+_rng = np.random.default_rng()
+
+# Minimum accumulated path delay before yielding to the event loop (~1 frame @ 60Hz)
+_SLEEP_COALESCE_MS = 16.0
+
+# In-page path replay: dispatches synthetic pointer/mouse moves on a setTimeout
+# schedule and resolves once the whole path has played (one CDP round-trip).
+_IN_PAGE_MOVE_JS = """
+async (pts) => {
+    const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
+    for (const [x, y, d] of pts) {
+        const target = document.elementFromPoint(x, y) || document.body || document.documentElement;
+        const init = { clientX: x, clientY: y, bubbles: true, cancelable: true, view: window };
+        target.dispatchEvent(new PointerEvent('pointermove', init));
+        target.dispatchEvent(new MouseEvent('mousemove', init));
+        if (d > 0) await sleep(d);
+    }
+}
+"""
+
+
+# Bernstein -> power basis for a cubic: [A, B, C, D] = M · [P0, P1, P2, P3]
+# so that P(t) = A·t³ + B·t² + C·t + D
+_BERNSTEIN_TO_POWER = np.array([
+    [-1.0, 3.0, -3.0, 1.0],
+    [3.0, -6.0, 3.0, 0.0],
+    [-3.0, 3.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0, 0.0],
+])
+_BERNSTEIN_TO_POWER.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _t_tables(steps: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-`steps` tables that don't depend on the endpoints: the power basis
+    rows [t³, t², t, 1] (4 x steps+1) and the Fitts's Law delay curve.
+    steps comes from a small set, so hits are ~100%.
+    Arrays are read-only because they are shared between calls.
+    """
+    t = np.linspace(0.0, 1.0, steps + 1)
+    t2 = t * t
+    t3 = t2 * t
+    basis = np.vstack((t3, t2, t, np.ones_like(t)))
+    
+    # Fitts's Law: Velocity curve (Ease-In-Out)
+    # Slow at start and end, fast in middle
+    # Smoothstep 3t² - 2t³: branchless, C¹-continuous and monotonic like the
+    # piecewise ease-in/ease-out quad, without evaluating both halves
+    ease_t = 3.0 * t2 - 2.0 * t3
+    
+    # Delay based on ease curve (faster in middle)
+    base_delay = 5  # ms per step
+    delay_ms = base_delay + (1 - ease_t) * 10  # 5-15ms range
+    
+    basis.setflags(write=False)
+    delay_ms.setflags(write=False)
+    return basis, delay_ms
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _bezier_kernel(ax, bx, cx, dx, ay, by, cy, dy, steps, jx, jy):
+        """Native Bezier path kernel: Horner power-basis eval + smoothstep delays."""
+        n = steps + 1
+        xs = np.empty(n)
+        ys = np.empty(n)
+        delays = np.empty(n)
+        for i in range(n):
+            t = i / steps
+            xs[i] = ((ax * t + bx) * t + cx) * t + dx + jx[i]
+            ys[i] = ((ay * t + by) * t + cy) * t + dy + jy[i]
+            ease_t = t * t * (3.0 - 2.0 * t)
+            delays[i] = 5.0 + (1.0 - ease_t) * 10.0
+        return xs, ys, delays
+
+    # JIT warmup at import (CHIMERA_WARMUP_JIT=0 to skip), same as stealth.py
+    if os.getenv("CHIMERA_WARMUP_JIT", "1") == "1":
+        _bezier_kernel(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 2, np.zeros(3), np.zeros(3))
+else:
+    _bezier_kernel = None
+
 
 class BiologicalMove:
     """
@@ -28,7 +119,7 @@ class BiologicalMove:
         end: Tuple[float, float],
         steps: int = 30,
         jitter: float = 1.5
-    ) -> List[Tuple[float, float, float]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Generate Bezier curve path with Gaussian noise.
         
@@ -39,56 +130,42 @@ class BiologicalMove:
             jitter: Gaussian noise amplitude (pixels)
         
         Returns:
-            List of (x, y, delay_ms) tuples
+            (xs, ys, delays_ms) parallel float64 arrays of length steps + 1
+            (delays_ms may be a shared read-only table; don't mutate it)
         """
         # Control points for Bezier curve (creates natural arc)
-        mid_x = (start[0] + end[0]) / 2 + random.uniform(-50, 50)
-        mid_y = (start[1] + end[1]) / 2 + random.uniform(-30, 30)
+        arc_x, arc_y = _rng.uniform((-50.0, -30.0), (50.0, 30.0))
+        mid_x = (start[0] + end[0]) / 2 + arc_x
+        mid_y = (start[1] + end[1]) / 2 + arc_y
         
-        path = []
+        # Inner control points (pulled 30% toward the arc midpoint)
+        p1x = start[0] + (mid_x - start[0]) * 0.3
+        p1y = start[1] + (mid_y - start[1]) * 0.3
+        p2x = end[0] + (mid_x - end[0]) * 0.3
+        p2y = end[1] + (mid_y - end[1]) * 0.3
         
-        for i in range(steps + 1):
-            t = i / steps
-            
-            # Cubic Bezier curve (4 control points)
-            # P(t) = (1-t)³P₀ + 3(1-t)²tP₁ + 3(1-t)t²P₂ + t³P₃
-            x = (
-                (1 - t) ** 3 * start[0] +
-                3 * (1 - t) ** 2 * t * (start[0] + (mid_x - start[0]) * 0.3) +
-                3 * (1 - t) * t ** 2 * (end[0] + (mid_x - end[0]) * 0.3) +
-                t ** 3 * end[0]
-            )
-            y = (
-                (1 - t) ** 3 * start[1] +
-                3 * (1 - t) ** 2 * t * (start[1] + (mid_y - start[1]) * 0.3) +
-                3 * (1 - t) * t ** 2 * (end[1] + (mid_y - end[1]) * 0.3) +
-                t ** 3 * end[1]
-            )
-            
-            # Add Gaussian noise (micro-tremors)
-            jitter_x = random.gauss(0, jitter)
-            jitter_y = random.gauss(0, jitter)
-            x += jitter_x
-            y += jitter_y
-            
-            # Fitts's Law: Velocity curve (Ease-In-Out)
-            # Slow at start and end, fast in middle
-            # Initialize ease_t to prevent UnboundLocalError
-            ease_t = 0.0
-            if t < 0.5:
-                # Ease-in (acceleration)
-                ease_t = 2 * t * t
-            else:
-                # Ease-out (deceleration)
-                ease_t = 1 - pow(-2 * t + 2, 2) / 2
-            
-            # Delay based on ease curve (faster in middle)
-            base_delay = 5  # ms per step
-            delay_ms = base_delay + (1 - ease_t) * 10  # 5-15ms range
-            
-            path.append((x, y, delay_ms))
+        # Cubic Bezier in power basis: P(t) = A·t³ + B·t² + C·t + D
+        # Both axes at once: rows are x/y, columns the four control points
+        control = np.array([
+            [start[0], p1x, p2x, end[0]],
+            [start[1], p1y, p2y, end[1]],
+        ])
+        coeffs = control @ _BERNSTEIN_TO_POWER.T  # (2, 4): A, B, C, D per axis
+        
+        # Gaussian noise (micro-tremors), drawn in bulk for every step and axis
+        noise = _rng.normal(0.0, jitter, (2, steps + 1))
         
-        return path
+        if _bezier_kernel is not None:
+            # Numba-compiled loop (same math as the NumPy path below)
+            (ax, bx, cx, dx), (ay, by, cy, dy) = coeffs.tolist()
+            x, y, delay_ms = _bezier_kernel(ax, bx, cx, dx, ay, by, cy, dy, steps, noise[0], noise[1])
+        else:
+            # Vectorized evaluation of both axes over all steps in one matmul
+            # against the cached [t³, t², t, 1] basis
+            basis, delay_ms = _t_tables(steps)
+            x, y = coeffs @ basis + noise
+        
+        return x, y, delay_ms
     
     @staticmethod
     async def move_mouse_biological(
@@ -104,20 +181,55 @@ class BiologicalMove:
             page: Playwright page
             start: Starting (x, y) position
             end: Ending (x, y) position
-            steps: Number of path steps (auto-calculated if None)
+            steps: Number of path steps (auto-calculated from distance if None;
+                moves under 15px then skip the Bezier path entirely)
         """
         # Calculate steps based on distance (longer moves = more steps)
-        distance = math.sqrt((end[0] - start[0]) ** 2 + (end[1] - start[1]) ** 2)
         if steps is None:
-            steps = max(20, int(distance / 10))  # ~10px per step
+            dx = end[0] - start[0]
+            dy = end[1] - start[1]
+            d2 = dx * dx + dy * dy  # squared distance; gate without a sqrt
+            # Short nudges don't need a curve: one direct move, no path/sleeps
+            if d2 < 225:  # 15px²
+                await page.mouse.move(end[0], end[1])
+                return
+            steps = max(6, min(60, int(d2 ** 0.5 / 12)))  # ~12px per step, clamped
         
         # Generate Bezier path
-        path = BiologicalMove.generate_bezier_path(start, end, steps)
+        xs, ys, delays = BiologicalMove.generate_bezier_path(start, end, steps)
         
-        # Execute movement
-        for x, y, delay_ms in path:
+        # Execute movement: issue moves back-to-back and only yield to the event
+        # loop once the accumulated delay reaches ~one frame, so a 50-step path
+        # costs a handful of sleeps instead of one per point
+        pending_ms = 0.0
+        for x, y, delay_ms in zip(xs.tolist(), ys.tolist(), delays.tolist()):
             await page.mouse.move(x, y)
-            await asyncio.sleep(delay_ms / 1000.0)  # Convert ms to seconds
+            pending_ms += delay_ms
+            if pending_ms >= _SLEEP_COALESCE_MS:
+                await asyncio.sleep(pending_ms / 1000.0)  # Convert ms to seconds
+                pending_ms = 0.0
+        if pending_ms:
+            await asyncio.sleep(pending_ms / 1000.0)
+    
+    @staticmethod
+    async def move_mouse_in_page(
+        page: Page,
+        path: Sequence[Tuple[float, float, float]]
+    ) -> None:
+        """
+        Replay a path in-page with synthetic mousemove events (single page.evaluate).
+        
+        Events are untrusted (no Input.dispatchMouseEvent), so only use this where
+        input-system fidelity isn't required (e.g. liveness hovers). Keep
+        move_mouse_biological for anything that leads to a click.
+        
+        Args:
+            page: Playwright page
+            path: (x, y, delay_ms) points; delay is the pause after each point
+        """
+        if not path:
+            return
+        await page.evaluate(_IN_PAGE_MOVE_JS, [[float(x), float(y), float(d)] for x, y, d in path])
 
 
 class NaturalReader:
@@ -129,7 +241,8 @@ class NaturalReader:
     async def micro_scroll_sequence(
         page: Page,
         total_distance: int = 500,
-        micro_scrolls: int = 12
+        micro_scrolls: int = 12,
+        coalesce_ms: float = 10.0
     ) -> None:
         """
         Perform natural reading scroll with micro-saccades.
@@ -138,24 +251,35 @@ class NaturalReader:
             page: Playwright page
             total_distance: Total scroll distance (pixels)
             micro_scrolls: Number of micro-scrolls (10-15 for natural reading)
+            coalesce_ms: Fixation pauses are summed and slept in one go once they
+                reach this many ms (0 sleeps after every scroll)
         """
         scroll_per_step = total_distance / micro_scrolls
         
-        for i in range(micro_scrolls):
-            # Micro-scroll (2-5px with variation)
-            scroll_amount = scroll_per_step + random.uniform(-1, 1)
+        # Draw all variation up front (one RNG call per series, not per step)
+        # Micro-scroll (2-5px with variation)
+        scroll_amounts = (scroll_per_step + _rng.uniform(-1, 1, micro_scrolls)).tolist()
+        # Random pause (5-15ms) - simulates eye fixation
+        pauses_ms = _rng.uniform(5, 15, micro_scrolls).tolist()
+        
+        # Send N wheel events, then one sleep for their combined fixation time
+        pending_ms = 0.0
+        for scroll_amount, pause_ms in zip(scroll_amounts, pauses_ms):
             await page.mouse.wheel(0, scroll_amount)
-            
-            # Random pause (5-15ms) - simulates eye fixation
-            pause_ms = random.uniform(5, 15)
-            await asyncio.sleep(pause_ms / 1000.0)
+            pending_ms += pause_ms
+            if pending_ms >= coalesce_ms:
+                await asyncio.sleep(pending_ms / 1000.0)
+                pending_ms = 0.0
+        if pending_ms:
+            await asyncio.sleep(pending_ms / 1000.0)
     
     @staticmethod
     async def curiosity_hover(
         page: Page,
         viewport_width: int,
         viewport_height: int,
-        num_hovers: int = 3
+        num_hovers: int = 3,
+        in_page: bool = False
     ) -> None:
         """
         Perform random hover events over white-space to trigger liveness listeners.
@@ -165,22 +289,41 @@ class NaturalReader:
             viewport_width: Viewport width
             viewport_height: Viewport height
             num_hovers: Number of hover events
+            in_page: Replay all hovers in one page.evaluate (synthetic events) instead
+                of one Playwright mouse.move + sleep round-trip per point. Synthetic
+                events have isTrusted=false, so keep this off on pages that score
+                liveness (e.g. CreepJS validation)
         """
+        # Draw all hover randomness up front (one RNG call per series)
+        # Random position (avoid edges)
+        xs = _rng.integers(100, viewport_width - 100, num_hovers, endpoint=True).tolist()
+        ys = _rng.integers(100, viewport_height - 100, num_hovers, endpoint=True).tolist()
+        # Small jitter (micro-movement)
+        jitters = _rng.uniform(-3, 3, (num_hovers, 2)).tolist()
+        # Look / between-hover pauses
+        look_pauses = _rng.uniform(0.2, 0.5, num_hovers).tolist()
+        gap_pauses = _rng.uniform(0.3, 0.7, num_hovers).tolist()
+        
+        if in_page:
+            # Move → look → jitter → pause, for every hover, in a single hop
+            path = []
+            for i in range(num_hovers):
+                path.append((xs[i], ys[i], look_pauses[i] * 1000.0))
+                path.append((xs[i] + jitters[i][0], ys[i] + jitters[i][1], gap_pauses[i] * 1000.0))
+            await BiologicalMove.move_mouse_in_page(page, path)
+            return
+        
         for i in range(num_hovers):
-            # Random position (avoid edges)
-            x = random.randint(100, viewport_width - 100)
-            y = random.randint(100, viewport_height - 100)
+            x, y = xs[i], ys[i]
             
             # Move to position
             await page.mouse.move(x, y)
             
             # Brief pause (simulates "looking")
-            await asyncio.sleep(random.uniform(0.2, 0.5))
+            await asyncio.sleep(look_pauses[i])
             
             # Small jitter (micro-movement)
-            jitter_x = x + random.uniform(-3, 3)
-            jitter_y = y + random.uniform(-3, 3)
-            await page.mouse.move(jitter_x, jitter_y)
+            await page.mouse.move(x + jitters[i][0], y + jitters[i][1])
             
             # Pause before next hover
-            await asyncio.sleep(random.uniform(0.3, 0.7))
+            await asyncio.sleep(gap_pauses[i])
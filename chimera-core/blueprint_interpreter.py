@@ -8,20 +8,90 @@ Uses the worker's page, process_vision (VLM), and safe_click.
 import asyncio
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List
 
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER_RE = re.compile(r"\{\{([^}]+)\}\}")
+
 
 def _expand(value: str, lead: Dict[str, Any]) -> str:
-    """Replace {{key}} with lead[key]."""
+    """Replace {{key}} with lead[key] (single scan; unknown/None keys are left as-is)."""
     if not value or not isinstance(value, str):
         return str(value or "")
-    for k, v in (lead or {}).items():
-        if v is None:
-            continue
-        value = value.replace("{{" + str(k) + "}}", str(v))
-    return value
+    lead = lead or {}
+
+    def _sub(m: "re.Match[str]") -> str:
+        v = lead.get(m.group(1))
+        return m.group(0) if v is None else str(v)
+
+    return _PLACEHOLDER_RE.sub(_sub, value)
+
+
+async def _handle_goto(step: Dict[str, Any], page: Any, lead: Dict[str, Any], worker: Any) -> None:
+    url = _expand(step.get("url") or "", lead)
+    if url:
+        await page.goto(url, wait_until=step.get("wait_until") or "domcontentloaded", timeout=int(step.get("timeout") or 45000))
+
+
+async def _handle_wait(step: Dict[str, Any], page: Any, lead: Dict[str, Any], worker: Any) -> None:
+    sec = step.get("seconds") or 0
+    ms = step.get("ms") or 0
+    if ms:
+        await asyncio.sleep(ms / 1000.0)
+    else:
+        await asyncio.sleep(float(sec))
+
+
+async def _handle_click(step: Dict[str, Any], page: Any, lead: Dict[str, Any], worker: Any) -> None:
+    sel = step.get("selector") or step.get("sel")
+    if sel:
+        try:
+            if hasattr(worker, "safe_click"):
+                await worker.safe_click(str(sel), timeout=int(step.get("timeout") or 30000), intent=step.get("intent") or "blueprint_click")
+            else:
+                await page.click(sel, timeout=int(step.get("timeout") or 30000))
+        except Exception as e:
+            logger.warning("Blueprint click %s: %s", sel, e)
+
+
+async def _handle_fill(step: Dict[str, Any], page: Any, lead: Dict[str, Any], worker: Any) -> None:
+    sel = step.get("selector") or step.get("sel")
+    val = _expand(step.get("value") or step.get("text") or "", lead)
+    if sel is not None:
+        try:
+            await page.fill(str(sel), str(val))
+            if step.get("press_enter"):
+                await page.keyboard.press("Enter")
+        except Exception as e:
+            logger.warning("Blueprint fill %s: %s", sel, e)
+
+
+async def _handle_vlm(step: Dict[str, Any], page: Any, lead: Dict[str, Any], worker: Any) -> None:
+    intent = step.get("intent") or step.get("text_command") or step.get("text") or "primary action"
+    try:
+        shot = await worker.take_screenshot()
+        coords = await worker.process_vision(shot, context=step.get("context") or "blueprint", text_command=intent)
+        if coords and coords.get("found") and coords.get("x") is not None and coords.get("y") is not None:
+            await page.mouse.click(float(coords["x"]), float(coords["y"]))
+        else:
+            logger.warning("Blueprint vlm_ground: no coords for %s", intent)
+    except Exception as e:
+        logger.warning("Blueprint vlm_ground %s: %s", intent, e)
+
+
+# Step type -> handler (one dict lookup per step instead of an if-ladder)
+_DISPATCH: Dict[str, Callable[[Dict[str, Any], Any, Dict[str, Any], Any], Awaitable[None]]] = {
+    "goto": _handle_goto,
+    "wait": _handle_wait,
+    "click": _handle_click,
+    "input": _handle_fill,
+    "type": _handle_fill,
+    "fill": _handle_fill,
+    "vlm_ground": _handle_vlm,
+    "vlm": _handle_vlm,
+    "vision": _handle_vlm,
+}
 
 
 async def execute_blueprint_instructions(worker: Any, mission: Dict[str, Any]) -> Dict[str, Any]:
@@ -45,58 +115,10 @@ async def execute_blueprint_instructions(worker: Any, mission: Dict[str, Any]) -
             continue
         typ = (step.get("type") or step.get("action") or "").strip().lower()
 
-        if typ == "goto":
-            url = _expand(step.get("url") or "", lead)
-            if url:
-                await page.goto(url, wait_until=step.get("wait_until") or "domcontentloaded", timeout=int(step.get("timeout") or 45000))
+        handler = _DISPATCH.get(typ)
+        if handler is None:
+            logger.debug("Blueprint: unknown step type %s", typ)
             continue
-
-        if typ == "wait":
-            sec = step.get("seconds") or 0
-            ms = step.get("ms") or 0
-            if ms:
-                await asyncio.sleep(ms / 1000.0)
-            else:
-                await asyncio.sleep(float(sec))
-            continue
-
-        if typ == "click":
-            sel = step.get("selector") or step.get("sel")
-            if sel:
-                try:
-                    if hasattr(worker, "safe_click"):
-                        await worker.safe_click(str(sel), timeout=int(step.get("timeout") or 30000), intent=step.get("intent") or "blueprint_click")
-                    else:
-                        await page.click(sel, timeout=int(step.get("timeout") or 30000))
-                except Exception as e:
-                    logger.warning("Blueprint click %s: %s", sel, e)
-            continue
-
-        if typ in ("input", "type", "fill"):
-            sel = step.get("selector") or step.get("sel")
-            val = _expand(step.get("value") or step.get("text") or "", lead)
-            if sel is not None:
-                try:
-                    await page.fill(str(sel), str(val))
-                    if step.get("press_enter"):
-                        await page.keyboard.press("Enter")
-                except Exception as e:
-                    logger.warning("Blueprint fill %s: %s", sel, e)
-            continue
-
-        if typ in ("vlm_ground", "vlm", "vision"):
-            intent = step.get("intent") or step.get("text_command") or step.get("text") or "primary action"
-            try:
-                shot = await worker.take_screenshot()
-                coords = await worker.process_vision(shot, context=step.get("context") or "blueprint", text_command=intent)
-                if coords and coords.get("found") and coords.get("x") is not None and coords.get("y") is not None:
-                    await page.mouse.click(float(coords["x"]), float(coords["y"]))
-                else:
-                    logger.warning("Blueprint vlm_ground: no coords for %s", intent)
-            except Exception as e:
-                logger.warning("Blueprint vlm_ground %s: %s", intent, e)
-            continue
-
-        logger.debug("Blueprint: unknown step type %s", typ)
+        await handler(step, page, lead, worker)
 
     return {"mission_id": mission_id, "status": "completed", "blueprint_done": True}
@@ -9,7 +9,9 @@ No API cost. Fallback to CapSolver (Tier 3) when VLM fails after max_attempts.
 """
 
 import re
+import asyncio
 import random
+import hashlib
 import logging
 from typing import Any, List, Optional, Tuple
 
@@ -22,28 +24,88 @@ COT_PROMPT = (
     "as [x, y] or 'x y' pairs. If a single element, one pair. Output format: x1,y1 x2,y2 ... or x1 y1, x2 y2. Answer:"
 )
 
+_CHALLENGE_FRAME_SELECTOR = "iframe[title*='challenge'], iframe[src*='recaptcha'], iframe[src*='hcaptcha']"
+
+# Cheap puzzle-state probe: tile image sources + instruction text (no pixel encode)
+_PUZZLE_STATE_JS = (
+    "() => { const d = document.querySelector('.rc-imageselect-desc') || document.querySelector('[class*=\"imageselect-desc\"]'); "
+    "return Array.from(document.images, i => i.src).join('|') + '#' + ((d && d.innerText) || ''); }"
+)
+
+# Pairs: "100 200" or "100,200" or "(100,200)" or "[100,200]" (brackets don't affect the captures)
+_COORD_RE = re.compile(r"(\d+)(?:\s*,\s*|\s+)(\d+)")
+
 
 def _parse_coords_from_response(description: str, single_x: Optional[int] = None, single_y: Optional[int] = None) -> List[Tuple[int, int]]:
     """Parse 'x y' or 'x,y' pairs from VLM description; include single (x,y) if provided."""
     out: List[Tuple[int, int]] = []
+    seen: set = set()  # O(1) dedup; out keeps first-seen order
     if single_x is not None and single_y is not None:
-        out.append((int(single_x), int(single_y)))
-    # Pairs: "100 200" or "100,200" or "(100,200)" or "[100,200]"
-    for m in re.finditer(r"[\[]?\s*(\d+)\s*[,]\s*(\d+)\s*[\]]?|\(?\s*(\d+)\s+(\d+)\s*\)?|(\d+)\s+(\d+)", description or ""):
-        g = m.groups()
-        x = int(g[0] or g[2] or g[4] or 0)
-        y = int(g[1] or g[3] or g[5] or 0)
-        if (x, y) not in out:
-            out.append((x, y))
+        key = (int(single_x), int(single_y))
+        seen.add(key)
+        out.append(key)
+    # Only scan the final answer block: skips CoT text ("Step 1", grid sizes) that
+    # would yield false-positive pairs and cuts the bytes the regex touches
+    desc = description or ""
+    idx = desc.rfind("Answer")
+    if idx != -1:
+        desc = desc[idx:]
+    for m in _COORD_RE.finditer(desc):
+        key = (int(m.group(1)), int(m.group(2)))
+        if key not in seen:
+            seen.add(key)
+            out.append(key)
     return out if out else ([(single_x, single_y)] if single_x is not None and single_y is not None else [])
 
 
+async def _capture_puzzle(page: Any) -> Tuple[Optional[bytes], float, float]:
+    """Screenshot the challenge iframe (or full page). Returns (png, offset_x, offset_y)."""
+    offset_x, offset_y = 0.0, 0.0
+    try:
+        frame_el = await page.query_selector(_CHALLENGE_FRAME_SELECTOR)
+        if frame_el:
+            fr = await frame_el.content_frame()
+            if fr:
+                screenshot = await fr.screenshot()
+                box = await frame_el.bounding_box()
+                if box:
+                    offset_x, offset_y = float(box.get("x") or 0), float(box.get("y") or 0)
+            else:
+                screenshot = await page.screenshot()
+        else:
+            screenshot = await page.screenshot()
+    except Exception:
+        screenshot = await page.screenshot()
+    return screenshot, offset_x, offset_y
+
+
+async def _puzzle_signature(page: Any) -> Optional[bytes]:
+    """
+    Cheap fingerprint of the challenge state (frame bounding box + tile sources + instruction).
+    Microseconds to hash vs. tens of ms for a screenshot. None when it can't be determined.
+    """
+    try:
+        frame_el = await page.query_selector(_CHALLENGE_FRAME_SELECTOR)
+        if not frame_el:
+            return None
+        fr = await frame_el.content_frame()
+        if not fr:
+            return None
+        box = await frame_el.bounding_box()
+        state = await fr.evaluate(_PUZZLE_STATE_JS)
+        return hashlib.blake2b(f"{box}|{state}".encode("utf-8", "replace"), digest_size=8).digest()
+    except Exception:
+        return None
+
+
 async def solve_visual_puzzle(
     page: Any,
     worker: Any,
     *,
     prompt_override: Optional[str] = None,
     instruction: str = "tiles with buses or vehicles",
+    cached_shot: Optional[bytes] = None,
+    shot_offset: Tuple[float, float] = (0.0, 0.0),
 ) -> bool:
     """
     CoT VLM: screenshot of puzzle → reason_and_ground → human_mouse_move + click.
@@ -52,27 +114,17 @@ async def solve_visual_puzzle(
     - worker: has process_vision(screenshot, context, text_command) and move_to(x,y).
     - prompt_override: use instead of default CoT + instruction.
     - instruction: semantic target (e.g. "tiles with buses") for the default prompt.
+    - cached_shot / shot_offset: reuse a screenshot (and its iframe offset) instead of capturing.
 
     Returns True if at least one click was executed.
     """
     try:
         # 1. Screenshot (challenge iframe or full page)
-        offset_x, offset_y = 0.0, 0.0
-        try:
-            frame_el = await page.query_selector("iframe[title*='challenge'], iframe[src*='recaptcha'], iframe[src*='hcaptcha']")
-            if frame_el:
-                fr = await frame_el.content_frame()
-                if fr:
-                    screenshot = await fr.screenshot()
-                    box = await frame_el.bounding_box()
-                    if box:
-                        offset_x, offset_y = float(box.get("x") or 0), float(box.get("y") or 0)
-                else:
-                    screenshot = await page.screenshot()
-            else:
-                screenshot = await page.screenshot()
-        except Exception:
-            screenshot = await page.screenshot()
+        if cached_shot:
+            screenshot = cached_shot
+            offset_x, offset_y = shot_offset
+        else:
+            screenshot, offset_x, offset_y = await _capture_puzzle(page)
 
         if not screenshot or len(screenshot) < 8:
             return False
@@ -80,7 +132,7 @@ async def solve_visual_puzzle(
         # 1b. 2026: Extract instruction from challenge DOM (reCAPTCHA: "Select all images with X")
         resolved_instruction = instruction
         try:
-            frame_el = await page.query_selector("iframe[title*='challenge'], iframe[src*='recaptcha'], iframe[src*='hcaptcha']")
+            frame_el = await page.query_selector(_CHALLENGE_FRAME_SELECTOR)
             fr = await frame_el.content_frame() if frame_el else None
             if fr and not prompt_override:
                 raw = await fr.evaluate(
@@ -126,7 +178,7 @@ async def solve_visual_puzzle(
                 await page.mouse.click(float(x), float(y), delay=delay)
                 logger.info("Captcha agent: clicked (%s, %s) delay=%s", x, y, delay)
                 clicked += 1
-                await __import__("asyncio").sleep(0.2 + random.random() * 0.2)
+                await asyncio.sleep(0.2 + random.random() * 0.2)
             except Exception as e:
                 logger.debug("Captcha agent click (%s,%s): %s", x, y, e)
         return clicked > 0
@@ -143,9 +195,23 @@ async def solve_with_vlm_first(
     """
     Tier 2: Try VLM agent up to max_attempts. Returns True if solved, False to fall back to CapSolver (Tier 3).
     2026: 3 attempts; instruction is taken from challenge DOM when possible.
+    Screenshot is taken once and reused across retries while the challenge signature
+    (frame box + tile sources + instruction) is unchanged.
     """
+    shot: Optional[bytes] = None
+    offset: Tuple[float, float] = (0.0, 0.0)
+    sig: Optional[bytes] = None
     for i in range(max_attempts):
-        if await solve_visual_puzzle(page, worker):
+        new_sig = await _puzzle_signature(page)
+        if shot is None or new_sig is None or new_sig != sig:
+            try:
+                shot, ox, oy = await _capture_puzzle(page)
+                offset = (ox, oy)
+            except Exception as e:
+                logger.debug("Captcha agent capture: %s", e)
+                shot = None
+            sig = new_sig
+        if await solve_visual_puzzle(page, worker, cached_shot=shot, shot_offset=offset):
             return True
-        await __import__("asyncio").sleep(0.5 + (i * 0.5))
+        await asyncio.sleep(0.5 + (i * 0.5))
     return False
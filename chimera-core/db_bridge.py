@@ -8,21 +8,58 @@ Uses connection pooling for high-concurrency worker swarm.
 """
 
 import os
+import atexit
+import copy
+import csv
+import functools
+import io
+import json
 import logging
+import queue
+import re
+import select
 import psycopg2
+import psycopg2.errors
+import psycopg2.extensions
+import psycopg2.extras
 import random
-import hashlib
 from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
-from typing import Dict, Any, Optional
-from datetime import datetime
+from psycopg2.extras import RealDictCursor, execute_values
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
 import threading
+from dataclasses import dataclass
+import time
+from collections import OrderedDict, deque
 from urllib.parse import quote_plus, urlparse
 import secrets
 import uuid
+import zlib
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+
+def _dumps_json(value: Any) -> str:
+    """Serialize a JSONB payload to text (orjson when installed, ~5x faster on large maps)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; json handles them
+    return json.dumps(value)
+
+
+# Decode JSONB columns (site maps) with orjson too
+if ORJSON_AVAILABLE:
+    psycopg2.extras.register_default_jsonb(globally=True, loads=orjson.loads)
+
+
 def _infer_log_role() -> str:
     explicit = os.getenv("CHIMERA_LOG_TAG")
     if explicit:
@@ -96,12 +133,73 @@ def _resolve_database_url() -> Optional[str]:
     return None
 
 
-DATABASE_URL = _resolve_database_url()
+@dataclass(frozen=True, slots=True)
+class DBConfig:
+    """DB settings, read from the environment once at import."""
+
+    url: Optional[str]
+    pool_min: int
+    pool_max: int
+    # asyncpg pool (db_bridge_async) is separate from the psycopg2 pool, so a
+    # process can hold up to pool_max + async_pool_max server connections
+    async_pool_max: int
+    connect_timeout: int
+    # Seconds a caller queues for a pooled connection before giving up
+    acquire_timeout: float
+    # Batched inserts: writers enqueue rows, one daemon thread flushes each
+    # table per batch. DB_ASYNC_INSERTS=0 writes inline.
+    async_inserts: bool
+    batch_max: int
+    # Rows per table the flusher may hold (queued + awaiting retry); new rows
+    # are rejected beyond this while the DB is unreachable
+    queue_max: int
+    flush_interval_ms: int
+    # Flushes at/above this size use COPY FROM STDIN; smaller ones use
+    # execute_values (COPY setup cost dominates for a handful of rows)
+    copy_threshold: int
+    read_cache_max: int
+    read_cache_ttl: float
+    # LISTEN for selector_repaired so other processes' repairs bust our cache
+    cache_listen: bool
+
+    @classmethod
+    def from_env(cls) -> "DBConfig":
+        return cls(
+            url=_resolve_database_url(),
+            pool_min=int(os.getenv("DB_POOL_MIN", "1")),
+            pool_max=int(os.getenv("DB_POOL_MAX", "10")),
+            async_pool_max=int(os.getenv("DB_ASYNC_POOL_MAX", "4")),
+            connect_timeout=int(os.getenv("DB_CONNECT_TIMEOUT", "5")),
+            acquire_timeout=float(os.getenv("DB_ACQUIRE_TIMEOUT", "2.0")),
+            async_inserts=os.getenv("DB_ASYNC_INSERTS", "1") != "0",
+            batch_max=int(os.getenv("DB_BATCH_MAX", "5000")),
+            queue_max=int(os.getenv("DB_QUEUE_MAX", "50000")),
+            flush_interval_ms=int(os.getenv("DB_FLUSH_INTERVAL_MS", "250")),
+            copy_threshold=int(os.getenv("DB_COPY_THRESHOLD", "1000")),
+            read_cache_max=int(os.getenv("DB_READ_CACHE_MAX", "10000")),
+            read_cache_ttl=float(os.getenv("DB_READ_CACHE_TTL", "60")),
+            cache_listen=os.getenv("DB_CACHE_LISTEN", "1") != "0",
+        )
+
+
+_CFG = DBConfig.from_env()
+DATABASE_URL = _CFG.url
+
+class _ChimeraConnection(psycopg2.extensions.connection):
+    """Pooled connection that remembers whether our statements are PREPAREd on it."""
+    chimera_prepared = False
+
 
 # Connection pool for high-concurrency worker swarm
 _connection_pool: Optional[pool.ThreadedConnectionPool] = None
 _pool_lock = threading.Lock()
 
+# ThreadedConnectionPool.getconn() fails immediately when exhausted and has no
+# fairness; callers that miss queue here FIFO and give up after
+# _CFG.acquire_timeout seconds.
+_pool_waiters: "deque[threading.Event]" = deque()
+_waiters_lock = threading.Lock()
+
 
 def get_connection_pool():
     """
@@ -119,27 +217,31 @@ def get_connection_pool():
         with _pool_lock:
             if _connection_pool is None:
                 try:
-                    # Connection pool: min 1, max 10 connections
+                    # Connection pool: DB_POOL_MIN..DB_POOL_MAX connections (1-10 by default).
+                    # Set DB_POOL_MIN=DB_POOL_MAX to open every connection up front.
                     # Supports high-concurrency worker swarm.
                     #
                     # IMPORTANT: Always set a connect timeout so Railway healthchecks
                     # don't time out if Postgres/DNS is temporarily unavailable.
-                    connect_timeout = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
                     _connection_pool = pool.ThreadedConnectionPool(
-                        minconn=1,
-                        maxconn=int(os.getenv("DB_POOL_MAX", "10")),
+                        minconn=min(_CFG.pool_min, _CFG.pool_max),
+                        maxconn=_CFG.pool_max,
                         dsn=DATABASE_URL,
-                        connect_timeout=connect_timeout,
+                        connect_timeout=_CFG.connect_timeout,
                         application_name="chimera-core",
                         keepalives=1,
                         keepalives_idle=30,
                         keepalives_interval=10,
                         keepalives_count=5,
+                        connection_factory=_ChimeraConnection,
                     )
                     logger.debug(
-                        "✅ PostgreSQL connection pool created (1-10 connections, "
-                        f"connect_timeout={connect_timeout}s)"
+                        f"✅ PostgreSQL connection pool created ({_CFG.pool_min}-{_CFG.pool_max} connections, "
+                        f"connect_timeout={_CFG.connect_timeout}s)"
                     )
+                    _bind_pool_fast_paths()
+                    atexit.register(_close_pool)
+                    _start_invalidation_listener()
                 except Exception as e:
                     logger.error(f"❌ Failed to create connection pool: {e}")
                     return None
@@ -147,23 +249,156 @@ def get_connection_pool():
     return _connection_pool
 
 
-def get_db_connection():
+def _pooled_get_db_connection(timeout: Optional[float] = None):
+    """Hot path once the pool is live (bound over get_db_connection)."""
+    # Nobody queued: take a free connection directly
+    if not _pool_waiters:
+        try:
+            return _connection_pool.getconn()
+        except pool.PoolError:
+            if _connection_pool.closed:
+                return None
+        except Exception as e:
+            logger.error(f"❌ Failed to get connection from pool: {e}")
+            return None
+
+    deadline = time.monotonic() + (_CFG.acquire_timeout if timeout is None else timeout)
+    ticket = threading.Event()
+    with _waiters_lock:
+        _pool_waiters.append(ticket)
+    try:
+        while True:
+            # Only the head of the queue may take a connection (FIFO)
+            if _pool_waiters[0] is ticket:
+                try:
+                    return _connection_pool.getconn()
+                except pool.PoolError:
+                    if _connection_pool.closed:
+                        return None
+                except Exception as e:
+                    logger.error(f"❌ Failed to get connection from pool: {e}")
+                    return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"⚠️ Timed out waiting for a pooled connection ({len(_pool_waiters)} waiting)"
+                )
+                return None
+            ticket.wait(remaining)
+            ticket.clear()
+    finally:
+        with _waiters_lock:
+            _pool_waiters.remove(ticket)
+            # Hand the turn to the next waiter; a connection may still be free
+            if _pool_waiters:
+                _pool_waiters[0].set()
+
+
+def _reset_session(conn) -> None:
+    """
+    Undo psycopg2 session characteristics a caller changed (autocommit,
+    isolation level, read-only, deferrable) before the next borrower gets it.
+
+    Client-side checks only, so a clean connection costs no round trip.
+    DISCARD ALL is deliberately not used: it would drop the PREPAREd
+    chimera_* statements tracked by chimera_prepared.
+    """
+    if (
+        conn.autocommit
+        or conn.isolation_level is not None
+        or conn.readonly is not None
+        or conn.deferrable is not None
+    ):
+        conn.set_session(
+            isolation_level="DEFAULT", readonly="DEFAULT", deferrable="DEFAULT", autocommit=False
+        )
+
+
+def _pooled_return_db_connection(conn):
+    """Hot path once the pool is live (bound over return_db_connection)."""
+    if not conn:
+        return
+    try:
+        status = (
+            psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+            if conn.closed
+            else conn.info.transaction_status
+        )
+        if status == psycopg2.extensions.TRANSACTION_STATUS_INTRANS:
+            # Caller left a transaction open; end it here so the pool hands out a clean session
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                status = psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+            else:
+                status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        if status == psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                _reset_session(conn)
+            except psycopg2.Error:
+                status = psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+        if status in (
+            psycopg2.extensions.TRANSACTION_STATUS_INERROR,
+            psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN,
+        ):
+            # Aborted or broken socket: never hand it out again
+            _connection_pool.putconn(conn, close=True)
+        else:
+            _connection_pool.putconn(conn)
+    except Exception as e:
+        logger.error(f"❌ Failed to return connection to pool: {e}")
+        try:
+            conn.close()
+        except Exception:
+            pass
+    if _pool_waiters:
+        with _waiters_lock:
+            if _pool_waiters:
+                _pool_waiters[0].set()
+
+
+def get_pool_wait_depth() -> int:
+    """Number of callers currently queued for a pooled connection."""
+    return len(_pool_waiters)
+
+
+def _bind_pool_fast_paths() -> None:
+    """
+    Rebind the module-level get/return functions to the branch-free pooled
+    versions. Internal callers resolve them as globals, so every DB op after
+    pool init skips the DATABASE_URL / pool-is-None checks.
+    """
+    globals()["get_db_connection"] = _pooled_get_db_connection
+    globals()["return_db_connection"] = _pooled_return_db_connection
+
+
+def _close_pool() -> None:
+    """atexit: flush queued rows, then close every pooled connection."""
+    if _connection_pool is None:
+        return
+    try:
+        _flush_at_exit()
+        _connection_pool.closeall()
+    except Exception:
+        pass
+
+
+def get_db_connection(timeout: Optional[float] = None):
     """
     Get PostgreSQL connection from pool.
     
+    Creates the pool on first use; afterwards this name is rebound to the
+    pooled fast path (see _bind_pool_fast_paths).
+    
+    Args:
+        timeout: Seconds to wait when the pool is exhausted (default DB_ACQUIRE_TIMEOUT)
+    
     Returns:
         psycopg2 connection object or None if pool unavailable
     """
-    pool = get_connection_pool()
-    if not pool:
-        return None
-    
-    try:
-        conn = pool.getconn()
-        return conn
-    except Exception as e:
-        logger.error(f"❌ Failed to get connection from pool: {e}")
+    if not get_connection_pool():
         return None
+    return _pooled_get_db_connection(timeout)
 
 
 def return_db_connection(conn):
@@ -173,19 +408,39 @@ def return_db_connection(conn):
     Args:
         conn: Connection to return
     """
-    pool = get_connection_pool()
-    if pool and conn:
-        try:
-            pool.putconn(conn)
-        except Exception as e:
-            logger.error(f"❌ Failed to return connection to pool: {e}")
-            try:
-                conn.close()
-            except:
-                pass
+    if _connection_pool is None:
+        return
+    _pooled_return_db_connection(conn)
+
+
+# DDL bundles are sent as one multi-statement execute (a single round-trip)
+_MISSION_RESULTS_DDL = """
+    CREATE TABLE IF NOT EXISTS mission_results (
+        id SERIAL PRIMARY KEY,
+        worker_id VARCHAR(100) NOT NULL,
+        trust_score FLOAT NOT NULL,
+        is_human BOOLEAN NOT NULL,
+        validation_method VARCHAR(50) DEFAULT 'creepjs',
+        fingerprint_details JSONB,
+        mission_type VARCHAR(100),
+        mission_status VARCHAR(50) DEFAULT 'completed',
+        error_message TEXT,
+        trace_url TEXT,
+        created_at TIMESTAMP DEFAULT NOW(),
+        completed_at TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_mission_results_worker_id
+      ON mission_results(worker_id);
+    CREATE INDEX IF NOT EXISTS idx_mission_results_trust_score
+      ON mission_results(trust_score);
+    CREATE INDEX IF NOT EXISTS idx_mission_results_is_human
+      ON mission_results(is_human);
+    CREATE INDEX IF NOT EXISTS idx_mission_results_created_at
+      ON mission_results(created_at);
+"""
 
 
-def ensure_mission_results_table(conn):
+def ensure_mission_results_table(conn) -> bool:
     """
     Ensure mission_results table exists.
     
@@ -193,53 +448,22 @@ def ensure_mission_results_table(conn):
     
     Args:
         conn: PostgreSQL connection
+    
+    Returns:
+        True if the table is verified, False otherwise
     """
     try:
         cur = conn.cursor()
-        
-        # Create mission_results table
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS mission_results (
-                id SERIAL PRIMARY KEY,
-                worker_id VARCHAR(100) NOT NULL,
-                trust_score FLOAT NOT NULL,
-                is_human BOOLEAN NOT NULL,
-                validation_method VARCHAR(50) DEFAULT 'creepjs',
-                fingerprint_details JSONB,
-                mission_type VARCHAR(100),
-                mission_status VARCHAR(50) DEFAULT 'completed',
-                error_message TEXT,
-                trace_url TEXT,
-                created_at TIMESTAMP DEFAULT NOW(),
-                completed_at TIMESTAMP
-            )
-        """)
-        
-        # Create indexes for faster lookups
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_mission_results_worker_id 
-            ON mission_results(worker_id)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_mission_results_trust_score 
-            ON mission_results(trust_score)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_mission_results_is_human 
-            ON mission_results(is_human)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_mission_results_created_at 
-            ON mission_results(created_at)
-        """)
-        
+        cur.execute(_MISSION_RESULTS_DDL)
         conn.commit()
         cur.close()
         logger.debug("✅ mission_results table verified")
+        return True
         
     except Exception as e:
         logger.error(f"❌ Failed to create mission_results table: {e}")
         conn.rollback()
+        return False
 
 
 def log_selector_repair(
@@ -264,60 +488,151 @@ def log_selector_repair(
         intent: Intent description (e.g., "click login button")
     
     Returns:
-        True if logged successfully, False otherwise
+        True if written (or queued for the flusher when DB_ASYNC_INSERTS=1),
+        False otherwise
     """
     if not DATABASE_URL:
         logger.debug("⚠️ DATABASE_URL not set - skipping selector repair log")
         return False
     
-    conn = get_db_connection()
-    if not conn:
+    ok = _submit_row("selector_repairs", (
+        worker_id,
+        original_selector,
+        new_selector,
+        method,
+        confidence,
+        intent,
+        _utcnow(),
+    ))
+    if not ok:
+        logger.error("❌ Failed to log selector repair")
         return False
     
-    try:
-        ensure_selector_repairs_table(conn)
-        
-        cur = conn.cursor()
-        
-        # Insert selector repair
-        cur.execute("""
-            INSERT INTO selector_repairs (
-                worker_id,
-                original_selector,
-                new_selector,
-                repair_method,
-                confidence,
-                intent,
-                created_at
-            ) VALUES (%s, %s, %s, %s, %s, %s, NOW())
-        """, (
-            worker_id,
-            original_selector,
-            new_selector,
-            method,
-            confidence,
-            intent
-        ))
-        
-        conn.commit()
-        cur.close()
-        return_db_connection(conn)
-        
-        logger.info(f"✅ Selector self-healed and updated in Postgres")
-        logger.debug(f"   Original: {original_selector}")
-        logger.debug(f"   New: {new_selector} (method: {method}, confidence: {confidence})")
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"❌ Failed to log selector repair: {e}")
-        if conn:
-            try:
-                conn.rollback()
-            except:
-                pass
-            return_db_connection(conn)
-        return False
+    logger.info(f"✅ Selector self-healed (repair {_insert_verb()} for Postgres)")
+    logger.debug(f"   Original: {original_selector}")
+    logger.debug(f"   New: {new_selector} (method: {method}, confidence: {confidence})")
+    
+    return True
+
+
+# Read-through cache for the hot lookup paths (selector heuristics, site maps).
+# Misses are cached too so unknown selectors don't hit Postgres on every call;
+# writers in this process bust their keys after commit.
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache with a per-entry TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Tuple[bool, Any]:
+        """Return (hit, value); expired entries count as misses."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_heuristic_cache = _TTLCache(_CFG.read_cache_max, _CFG.read_cache_ttl)
+_site_map_cache = _TTLCache(_CFG.read_cache_max, _CFG.read_cache_ttl)
+
+# Cross-process coherence: selector_repairs writers NOTIFY the repaired
+# selector ("*" when it won't fit a payload) and every process LISTENs on a
+# dedicated connection outside the pool.
+_REPAIR_CHANNEL = "selector_repaired"
+_NOTIFY_PAYLOAD_MAX = 7999  # bytes; Postgres rejects payloads of 8000+
+_listener_thread: Optional[threading.Thread] = None
+_listener_lock = threading.Lock()
+
+
+def _repair_payloads(selectors) -> List[str]:
+    payloads = set()
+    for selector in selectors:
+        if len(selector.encode("utf-8")) > _NOTIFY_PAYLOAD_MAX:
+            return ["*"]
+        payloads.add(selector)
+    return list(payloads)
+
+
+def _notify_selector_repairs(cur, selectors) -> None:
+    """Queue selector_repaired notifications (delivered when the transaction commits)."""
+    for payload in _repair_payloads(selectors):
+        cur.execute("SELECT pg_notify(%s, %s)", (_REPAIR_CHANNEL, payload))
+
+
+def _listen_for_repairs() -> None:
+    backoff = 1.0
+    while True:
+        conn = None
+        try:
+            conn = psycopg2.connect(
+                DATABASE_URL,
+                connect_timeout=_CFG.connect_timeout,
+                application_name="chimera-cache-listener",
+            )
+            conn.autocommit = True
+            conn.cursor().execute(f"LISTEN {_REPAIR_CHANNEL}")
+            # Anything repaired while we weren't listening is unknown; start clean
+            _heuristic_cache.clear()
+            backoff = 1.0
+            while True:
+                if select.select([conn], [], [], 30.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    payload = conn.notifies.pop(0).payload
+                    if payload == "*":
+                        _heuristic_cache.clear()
+                    else:
+                        _heuristic_cache.pop(payload)
+        except Exception as e:
+            logger.debug(f"⚠️ Cache invalidation listener reconnecting: {e}")
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+        time.sleep(backoff)
+        backoff = min(backoff * 2, 30.0)
+
+
+def _start_invalidation_listener() -> None:
+    global _listener_thread
+    if _listener_thread is not None or not _CFG.cache_listen or _CFG.read_cache_ttl <= 0:
+        return
+    with _listener_lock:
+        if _listener_thread is None:
+            _listener_thread = threading.Thread(
+                target=_listen_for_repairs, name="chimera-cache-listener", daemon=True
+            )
+            _listener_thread.start()
 
 
 def get_global_heuristic(selector_id: str) -> Optional[Dict[str, Any]]:
@@ -332,38 +647,28 @@ def get_global_heuristic(selector_id: str) -> Optional[Dict[str, Any]]:
     if not DATABASE_URL:
         return None
 
+    hit, cached = _heuristic_cache.get(selector_id)
+    if hit:
+        return dict(cached) if cached is not None else None
+
     conn = get_db_connection()
     if not conn:
         return None
 
     try:
-        ensure_selector_repairs_table(conn)
+        _ensure_schema(conn)
         cur = conn.cursor(cursor_factory=RealDictCursor)
-        cur.execute(
-            """
-            SELECT
-              original_selector,
-              new_selector,
-              repair_method,
-              confidence,
-              intent,
-              created_at
-            FROM selector_repairs
-            WHERE original_selector = %s
-            ORDER BY created_at DESC
-            LIMIT 1
-            """,
-            (selector_id,),
-        )
+        _execute_prepared(cur, "chimera_get_heuristic", (selector_id,))
         row = cur.fetchone()
         cur.close()
         return_db_connection(conn)
 
         if not row:
+            _heuristic_cache.set(selector_id, None)
             return None
 
         # Normalize keys for caller
-        return {
+        heuristic = {
             "original_selector": row.get("original_selector"),
             "new_selector": row.get("new_selector"),
             "method": row.get("repair_method"),
@@ -371,6 +676,8 @@ def get_global_heuristic(selector_id: str) -> Optional[Dict[str, Any]]:
             "intent": row.get("intent"),
             "created_at": row.get("created_at"),
         }
+        _heuristic_cache.set(selector_id, heuristic)
+        return dict(heuristic)
     except Exception as e:
         logger.debug(f"⚠️ Global heuristic lookup failed: {e}")
         try:
@@ -381,50 +688,65 @@ def get_global_heuristic(selector_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def ensure_selector_repairs_table(conn):
+_SELECTOR_REPAIRS_DDL = """
+    CREATE TABLE IF NOT EXISTS selector_repairs (
+        id SERIAL PRIMARY KEY,
+        worker_id VARCHAR(100) NOT NULL,
+        original_selector TEXT NOT NULL,
+        new_selector TEXT NOT NULL,
+        repair_method VARCHAR(50) DEFAULT 'isomorphic',
+        confidence FLOAT DEFAULT 0.85,
+        intent VARCHAR(255),
+        created_at TIMESTAMP DEFAULT NOW()
+    );
+    CREATE INDEX IF NOT EXISTS idx_selector_repairs_worker_id
+      ON selector_repairs(worker_id);
+    CREATE INDEX IF NOT EXISTS idx_selector_repairs_created_at
+      ON selector_repairs(created_at);
+"""
+
+
+def ensure_selector_repairs_table(conn) -> bool:
     """
     Ensure selector_repairs table exists.
     
     Args:
         conn: PostgreSQL connection
+    
+    Returns:
+        True if the table is verified, False otherwise
     """
     try:
         cur = conn.cursor()
-        
-        # Create selector_repairs table
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS selector_repairs (
-                id SERIAL PRIMARY KEY,
-                worker_id VARCHAR(100) NOT NULL,
-                original_selector TEXT NOT NULL,
-                new_selector TEXT NOT NULL,
-                repair_method VARCHAR(50) DEFAULT 'isomorphic',
-                confidence FLOAT DEFAULT 0.85,
-                intent VARCHAR(255),
-                created_at TIMESTAMP DEFAULT NOW()
-            )
-        """)
-        
-        # Create indexes
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_selector_repairs_worker_id 
-            ON selector_repairs(worker_id)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_selector_repairs_created_at 
-            ON selector_repairs(created_at)
-        """)
-        
+        cur.execute(_SELECTOR_REPAIRS_DDL)
         conn.commit()
         cur.close()
         logger.debug("✅ selector_repairs table verified")
+        return True
         
     except Exception as e:
         logger.error(f"❌ Failed to create selector_repairs table: {e}")
         conn.rollback()
+        return False
+
 
+_SITE_COGNITIVE_MAPS_DDL = """
+    CREATE TABLE IF NOT EXISTS site_cognitive_maps (
+        id SERIAL PRIMARY KEY,
+        url TEXT UNIQUE NOT NULL,
+        structure_hash VARCHAR(128),
+        map_data JSONB,
+        created_at TIMESTAMP DEFAULT NOW(),
+        updated_at TIMESTAMP DEFAULT NOW()
+    );
+    CREATE INDEX IF NOT EXISTS idx_site_cognitive_maps_url
+      ON site_cognitive_maps(url);
+    CREATE INDEX IF NOT EXISTS idx_site_cognitive_maps_updated_at
+      ON site_cognitive_maps(updated_at);
+"""
 
-def ensure_site_cognitive_maps_table(conn) -> None:
+
+def ensure_site_cognitive_maps_table(conn) -> bool:
     """
     Phase 9: Ensure site_cognitive_maps table exists.
 
@@ -432,73 +754,77 @@ def ensure_site_cognitive_maps_table(conn) -> None:
     """
     try:
         cur = conn.cursor()
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS site_cognitive_maps (
-                id SERIAL PRIMARY KEY,
-                url TEXT UNIQUE NOT NULL,
-                structure_hash VARCHAR(128),
-                map_data JSONB,
-                created_at TIMESTAMP DEFAULT NOW(),
-                updated_at TIMESTAMP DEFAULT NOW()
-            )
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_site_cognitive_maps_url
-            ON site_cognitive_maps(url)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_site_cognitive_maps_updated_at
-            ON site_cognitive_maps(updated_at)
-        """)
+        cur.execute(_SITE_COGNITIVE_MAPS_DDL)
         conn.commit()
         cur.close()
         logger.debug("✅ site_cognitive_maps table verified")
+        return True
     except Exception as e:
         logger.error(f"❌ Failed to create site_cognitive_maps table: {e}")
         conn.rollback()
+        return False
 
 
-def map_expiration_logic(updated_at: Optional[datetime], days: int = 7) -> bool:
+def map_expiration_logic(updated_at_ts: Optional[float], days: int = 7) -> bool:
     """
     Phase 9: Determine whether a cognitive map is stale.
+
+    Args:
+        updated_at_ts: updated_at as POSIX seconds (UTC), or None if unknown
+        days: Maximum age before the map is considered stale
     """
-    if not updated_at:
+    if updated_at_ts is None:
         return True
-    age = datetime.utcnow() - updated_at.replace(tzinfo=None)
-    return age.days >= int(days)
+    return time.time() - updated_at_ts >= days * 86400
 
 
-def get_latency_buffer(target_url: str) -> float:
-    """
-    Vanguard v2.0: Compute RTT buffer based on hardware location affinity.
-    Returns latency in seconds.
-    """
-    hardware_id = (
+def _hardware_id() -> str:
+    # Read per call: workers set CHIMERA_WORKER_ID for each mission
+    return (
         os.getenv("CHIMERA_HARDWARE_ID")
         or os.getenv("CHIMERA_WORKER_ID")
         or os.getenv("WORKER_ID")
         or os.getenv("RAILWAY_SERVICE_NAME")
         or "chimera-core"
     )
+
+
+# Dedicated RNG for latency jitter (avoids the shared module-level Random)
+_RNG = random.Random(f"{os.getpid()}:{secrets.randbits(64)}")
+
+_LATENCY_REGIONS = (
+    ("us-east", 38),
+    ("us-west", 52),
+    ("eu-west", 68),
+    ("ap-south", 92),
+    ("ap-northeast", 104),
+    ("sa-east", 118),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _pick_region(hardware_id: str, host: str) -> Tuple[str, int]:
+    """Deterministic (region, base_ms + domain bump) for this hardware/host pair."""
+    # Only needs a stable spread, not cryptographic strength; crc32 is in the
+    # stdlib, so every worker maps a given pair to the same region
+    h = zlib.crc32(f"{hardware_id}:{host}".encode("utf-8"))
+    region, base_ms = _LATENCY_REGIONS[h % len(_LATENCY_REGIONS)]
+    return region, base_ms + min(18, max(0, len(host) - 8))
+
+
+def get_latency_buffer(target_url: str) -> float:
+    """
+    Vanguard v2.0: Compute RTT buffer based on hardware location affinity.
+    Returns latency in seconds.
+    """
     try:
         host = urlparse(target_url or "").hostname or ""
     except Exception:
         host = ""
 
-    regions = [
-        ("us-east", 38),
-        ("us-west", 52),
-        ("eu-west", 68),
-        ("ap-south", 92),
-        ("ap-northeast", 104),
-        ("sa-east", 118),
-    ]
-    seed = hashlib.sha256(f"{hardware_id}:{host}".encode("utf-8")).hexdigest()
-    idx = int(seed[:2], 16) % len(regions)
-    region, base_ms = regions[idx]
-    domain_bump = min(18, max(0, len(host) - 8))
-    jitter = random.uniform(-6.0, 8.0)
-    latency_ms = max(12.0, float(base_ms + domain_bump + jitter))
+    region, base_ms = _pick_region(_hardware_id(), host)
+    jitter = _RNG.uniform(-6.0, 8.0)
+    latency_ms = max(12.0, float(base_ms + jitter))
     logger.info(f"Latency buffer applied: {int(latency_ms)}ms ({region})")
     return latency_ms / 1000.0
 
@@ -510,43 +836,40 @@ def get_site_map(url: str) -> Optional[Dict[str, Any]]:
     if not url or not DATABASE_URL:
         return None
 
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        ensure_site_cognitive_maps_table(conn)
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        cur.execute(
-            """
-            SELECT url, structure_hash, map_data, updated_at
-            FROM site_cognitive_maps
-            WHERE url = %s
-            LIMIT 1
-            """,
-            (url,),
-        )
-        row = cur.fetchone()
-        cur.close()
-        return_db_connection(conn)
-        if not row:
+    hit, row = _site_map_cache.get(url)
+    if not hit:
+        conn = get_db_connection()
+        if not conn:
             return None
-        stale = map_expiration_logic(row.get("updated_at"))
-        return {
-            "url": row.get("url"),
-            "structure_hash": row.get("structure_hash"),
-            "map_data": row.get("map_data"),
-            "updated_at": row.get("updated_at"),
-            "stale": stale,
-        }
-    except Exception as e:
-        logger.debug(f"⚠️ Cognitive map lookup failed: {e}")
+
         try:
-            conn.rollback()
-        except Exception:
-            pass
-        return_db_connection(conn)
+            _ensure_schema(conn)
+            cur = conn.cursor(cursor_factory=RealDictCursor)
+            _execute_prepared(cur, "chimera_get_site_map", (url,))
+            row = cur.fetchone()
+            cur.close()
+            return_db_connection(conn)
+        except Exception as e:
+            logger.debug(f"⚠️ Cognitive map lookup failed: {e}")
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return_db_connection(conn)
+            return None
+        _site_map_cache.set(url, row)
+
+    if not row:
         return None
+    # Staleness is time-dependent, so it is recomputed even on cache hits.
+    # map_data is nested JSON shared with the cache: hand out a private copy.
+    return {
+        "url": row.get("url"),
+        "structure_hash": row.get("structure_hash"),
+        "map_data": copy.deepcopy(row.get("map_data")),
+        "updated_at": row.get("updated_at"),
+        "stale": map_expiration_logic(row.get("updated_at_ts")),
+    }
 
 
 def update_site_map(url: str, data: Dict[str, Any]) -> bool:
@@ -561,22 +884,17 @@ def update_site_map(url: str, data: Dict[str, Any]) -> bool:
         return False
 
     try:
-        ensure_site_cognitive_maps_table(conn)
+        _ensure_schema(conn)
         cur = conn.cursor()
         structure_hash = data.get("structure_hash")
         map_data = data.get("map_data", data)
-        cur.execute(
-            """
-            INSERT INTO site_cognitive_maps (url, structure_hash, map_data, created_at, updated_at)
-            VALUES (%s, %s, %s, NOW(), NOW())
-            ON CONFLICT (url) DO UPDATE SET
-              structure_hash = EXCLUDED.structure_hash,
-              map_data = EXCLUDED.map_data,
-              updated_at = NOW()
-            """,
-            (url, structure_hash, psycopg2.extras.Json(map_data) if map_data is not None else None),
+        _execute_prepared(
+            cur,
+            "chimera_upsert_site_map",
+            (url, structure_hash, _dumps_json(map_data) if map_data is not None else None),
         )
         conn.commit()
+        _site_map_cache.pop(url)
         cur.close()
         return_db_connection(conn)
         return True
@@ -590,7 +908,26 @@ def update_site_map(url: str, data: Dict[str, Any]) -> bool:
         return False
 
 
-def ensure_hardware_entropy_table(conn) -> None:
+_HARDWARE_ENTROPY_DDL = """
+    CREATE TABLE IF NOT EXISTS hardware_entropy (
+        id SERIAL PRIMARY KEY,
+        worker_id VARCHAR(100) NOT NULL,
+        mission_id VARCHAR(255) NOT NULL,
+        gpu_seed BIGINT NOT NULL,
+        audio_seed BIGINT NOT NULL,
+        canvas_seed BIGINT NOT NULL,
+        created_at TIMESTAMP DEFAULT NOW()
+    );
+    CREATE INDEX IF NOT EXISTS idx_hardware_entropy_worker_id
+      ON hardware_entropy(worker_id);
+    CREATE INDEX IF NOT EXISTS idx_hardware_entropy_mission_id
+      ON hardware_entropy(mission_id);
+    CREATE INDEX IF NOT EXISTS idx_hardware_entropy_created_at
+      ON hardware_entropy(created_at);
+"""
+
+
+def ensure_hardware_entropy_table(conn) -> bool:
     """
     Phase 6: Ensure hardware_entropy table exists.
 
@@ -599,38 +936,40 @@ def ensure_hardware_entropy_table(conn) -> None:
     """
     try:
         cur = conn.cursor()
-
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS hardware_entropy (
-                id SERIAL PRIMARY KEY,
-                worker_id VARCHAR(100) NOT NULL,
-                mission_id VARCHAR(255) NOT NULL,
-                gpu_seed BIGINT NOT NULL,
-                audio_seed BIGINT NOT NULL,
-                canvas_seed BIGINT NOT NULL,
-                created_at TIMESTAMP DEFAULT NOW()
-            )
-        """)
-
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_hardware_entropy_worker_id
-            ON hardware_entropy(worker_id)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_hardware_entropy_mission_id
-            ON hardware_entropy(mission_id)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_hardware_entropy_created_at
-            ON hardware_entropy(created_at)
-        """)
-
+        cur.execute(_HARDWARE_ENTROPY_DDL)
         conn.commit()
         cur.close()
         logger.debug("✅ hardware_entropy table verified")
+        return True
     except Exception as e:
         logger.error(f"❌ Failed to create hardware_entropy table: {e}")
         conn.rollback()
+        return False
+
+
+# Mission seeds are drawn from the OS CSPRNG in bulk and handed out from
+# memory; the hardware_entropy rows themselves go through the batched writer.
+_ENTROPY_BATCH = 256
+_entropy_seeds: "deque[Tuple[int, int, int]]" = deque()
+_entropy_lock = threading.Lock()
+
+
+def _refill_entropy_seeds() -> None:
+    # Use 31-bit seeds (1..2^31-1) to stay within JS bitwise ops cleanly.
+    words = memoryview(os.urandom(12 * _ENTROPY_BATCH)).cast("I")
+    it = iter([w % 0x7FFFFFFF + 1 for w in words])
+    _entropy_seeds.extend(zip(it, it, it))
+
+
+def _take_entropy_seeds() -> Tuple[int, int, int]:
+    """Return one (gpu_seed, audio_seed, canvas_seed) triple."""
+    try:
+        return _entropy_seeds.popleft()
+    except IndexError:
+        with _entropy_lock:
+            if not _entropy_seeds:
+                _refill_entropy_seeds()
+            return _entropy_seeds.popleft()
 
 
 def allocate_hardware_entropy(worker_id: str, mission_id: Optional[str] = None) -> Optional[Dict[str, int]]:
@@ -649,40 +988,462 @@ def allocate_hardware_entropy(worker_id: str, mission_id: Optional[str] = None)
         return None
 
     mission_id = mission_id or f"mission-{uuid.uuid4()}"
+    gpu_seed, audio_seed, canvas_seed = _take_entropy_seeds()
 
-    # Use 31-bit seeds to stay within JS bitwise ops cleanly.
-    gpu_seed = secrets.randbelow(2**31 - 1) + 1
-    audio_seed = secrets.randbelow(2**31 - 1) + 1
-    canvas_seed = secrets.randbelow(2**31 - 1) + 1
-
-    conn = get_db_connection()
-    if not conn:
+    ok = _submit_row("hardware_entropy", (worker_id, mission_id, gpu_seed, audio_seed, canvas_seed, _utcnow()))
+    if not ok:
+        logger.error("❌ Failed to allocate hardware entropy")
         return None
 
+    logger.info(f"🧬 Hardware entropy allocated for mission: {mission_id}")
+    return {"gpu_seed": gpu_seed, "audio_seed": audio_seed, "canvas_seed": canvas_seed}
+
+
+# Schema is created once per process (boot or first DB use), not on every call
+_schema_ready = threading.Event()
+_schema_lock = threading.Lock()
+
+
+def _init_schema_once(conn) -> bool:
+    """
+    Run every ensure_*_table DDL bundle once for this process.
+    
+    The DDL is idempotent, so concurrent boots across processes are safe.
+    
+    Args:
+        conn: PostgreSQL connection
+    
+    Returns:
+        True if all tables are verified, False otherwise (retried on next use)
+    """
+    if _schema_ready.is_set():
+        return True
+    with _schema_lock:
+        if _schema_ready.is_set():
+            return True
+        ok = all([
+            ensure_mission_results_table(conn),
+            ensure_selector_repairs_table(conn),
+            ensure_site_cognitive_maps_table(conn),
+            ensure_hardware_entropy_table(conn),
+        ])
+        if ok:
+            _schema_ready.set()
+            logger.debug("✅ PostgreSQL schema initialized")
+        return ok
+
+
+def _bootstrap_connection():
+    """
+    Open a standalone connection for boot-time probe/DDL work, so bootstrap
+    never holds a pool slot while workers are starting.
+    
+    Returns:
+        psycopg2 connection (caller closes it) or None on failure
+    """
     try:
-        ensure_hardware_entropy_table(conn)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO hardware_entropy (worker_id, mission_id, gpu_seed, audio_seed, canvas_seed)
-            VALUES (%s, %s, %s, %s, %s)
-            """,
-            (worker_id, mission_id, gpu_seed, audio_seed, canvas_seed),
+        return psycopg2.connect(
+            DATABASE_URL,
+            connect_timeout=_CFG.connect_timeout,
+            application_name="chimera-bootstrap",
         )
+    except Exception as e:
+        logger.error(f"❌ Failed to open bootstrap connection: {e}")
+        return None
+
+
+def init_schema() -> bool:
+    """
+    Initialize the schema on a bootstrap connection (no-op once done).
+    
+    Returns:
+        True if the schema is ready, False otherwise
+    """
+    if _schema_ready.is_set():
+        return True
+    if not DATABASE_URL:
+        return False
+    conn = _bootstrap_connection()
+    if not conn:
+        return False
+    try:
+        return _init_schema_once(conn)
+    finally:
+        conn.close()
+
+
+def _ensure_schema(conn) -> None:
+    """
+    Hot-path guard: a single Event check once the schema is initialized, then
+    PREPARE our statements the first time a pooled connection is used.
+    """
+    if not _schema_ready.is_set():
+        _init_schema_once(conn)
+    if isinstance(conn, _ChimeraConnection) and not conn.chimera_prepared:
+        _prepare_statements(conn)
+
+
+# Batched inserts (see DBConfig.async_inserts / batch_max / copy_threshold).
+# table -> (columns, per-row VALUES template); timestamps come from Python so
+# every row fits the same template
+_INSERT_SPECS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "mission_results": (
+        (
+            "worker_id", "trust_score", "is_human", "validation_method", "fingerprint_details",
+            "mission_type", "mission_status", "error_message", "trace_url", "completed_at",
+        ),
+        "(%s, %s, %s, %s, %s::jsonb, %s, %s, %s, %s, %s)",
+    ),
+    "selector_repairs": (
+        ("worker_id", "original_selector", "new_selector", "repair_method", "confidence", "intent", "created_at"),
+        "(%s, %s, %s, %s, %s, %s, %s)",
+    ),
+    "hardware_entropy": (
+        ("worker_id", "mission_id", "gpu_seed", "audio_seed", "canvas_seed", "created_at"),
+        "(%s, %s, %s, %s, %s, %s)",
+    ),
+}
+
+_INSERT_QUEUES: Dict[str, "queue.Queue[tuple]"] = {table: queue.Queue() for table in _INSERT_SPECS}
+# Rows whose flush hit an outage; written before anything newer in the queue
+_RETRY_ROWS: Dict[str, "deque[tuple]"] = {table: deque() for table in _INSERT_SPECS}
+# Flusher backoff while the DB is unreachable (doubles per failed flush)
+_RETRY_BACKOFF_MIN_S = 0.5
+_RETRY_BACKOFF_MAX_S = 30.0
+_retry_delay = 0.0
+_retry_at = 0.0
+# Set by the first _flush_at_exit(); _close_pool and _start_flusher both register it
+_exit_flushed = False
+_flush_wakeup = threading.Event()
+_flusher_thread: Optional[threading.Thread] = None
+_flusher_lock = threading.Lock()
+_flush_lock = threading.Lock()
+
+
+def _numbered_placeholders(template: str) -> str:
+    counter = iter(range(1, 1000))
+    return re.sub(r"%s", lambda _m: f"${next(counter)}", template)
+
+
+# Server-side prepared statements (name -> SQL with $n params), created once per
+# pooled connection so hot reads/writes skip parse/plan on every call
+_PREPARED_STATEMENTS: Dict[str, str] = {
+    "chimera_get_heuristic": """
+        SELECT
+          original_selector,
+          new_selector,
+          repair_method,
+          confidence,
+          intent,
+          created_at
+        FROM selector_repairs
+        WHERE original_selector = $1
+        ORDER BY created_at DESC
+        LIMIT 1
+    """,
+    "chimera_get_site_map": """
+        SELECT url, structure_hash, map_data, updated_at,
+               EXTRACT(EPOCH FROM updated_at)::float8 AS updated_at_ts
+        FROM site_cognitive_maps
+        WHERE url = $1
+        LIMIT 1
+    """,
+    "chimera_upsert_site_map": """
+        INSERT INTO site_cognitive_maps (url, structure_hash, map_data, created_at, updated_at)
+        VALUES ($1, $2, $3::jsonb, NOW(), NOW())
+        ON CONFLICT (url) DO UPDATE SET
+          structure_hash = EXCLUDED.structure_hash,
+          map_data = EXCLUDED.map_data,
+          updated_at = NOW()
+    """,
+}
+for _table, (_columns, _template) in _INSERT_SPECS.items():
+    _PREPARED_STATEMENTS[f"chimera_insert_{_table}"] = (
+        f"INSERT INTO {_table} ({', '.join(_columns)}) VALUES {_numbered_placeholders(_template)}"
+    )
+
+
+def _prepare_statements(conn) -> None:
+    """PREPARE every statement on this connection (idempotent per session)."""
+    cur = conn.cursor()
+    try:
+        for name, sql in _PREPARED_STATEMENTS.items():
+            cur.execute("SAVEPOINT chimera_prepare")
+            try:
+                cur.execute(f"PREPARE {name} AS {sql}")
+            except psycopg2.errors.DuplicatePreparedStatement:
+                cur.execute("ROLLBACK TO SAVEPOINT chimera_prepare")
+            cur.execute("RELEASE SAVEPOINT chimera_prepare")
         conn.commit()
+        conn.chimera_prepared = True
+    except Exception as e:
+        logger.debug(f"⚠️ PREPARE failed, using plain statements: {e}")
+        conn.rollback()
+    finally:
         cur.close()
-        return_db_connection(conn)
 
-        logger.info(f"🧬 Hardware entropy allocated for mission: {mission_id}")
-        return {"gpu_seed": gpu_seed, "audio_seed": audio_seed, "canvas_seed": canvas_seed}
+
+def _execute_prepared(cur, name: str, params: tuple) -> None:
+    """EXECUTE a prepared statement, or run its plain SQL on unprepared connections."""
+    if getattr(cur.connection, "chimera_prepared", False):
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    else:
+        cur.execute(re.sub(r"\$\d+", "%s", _PREPARED_STATEMENTS[name]), params)
+
+
+def _utcnow() -> datetime:
+    """
+    Row timestamp (replaces server-side NOW() so rows can share a VALUES template).
+
+    Naive UTC, matching the TIMESTAMP (without time zone) columns: every write
+    path (execute_values, COPY text, asyncpg) stores it verbatim. An aware value
+    would be shifted to the session TimeZone by psycopg2 but not by COPY, and
+    asyncpg rejects it outright.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _copy_value(v: Any) -> Any:
+    if v is None:
+        return "\\N"
+    if isinstance(v, bool):
+        return "t" if v else "f"
+    if isinstance(v, datetime):
+        return v.isoformat()
+    return v
+
+
+def _copy_rows(cur, table: str, columns: Tuple[str, ...], rows: List[tuple]) -> None:
+    """Bulk load rows with COPY ... FROM STDIN (CSV, \\N for NULL)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow([_copy_value(v) for v in row])
+    buf.seek(0)
+    cur.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        buf,
+    )
+
+
+def _write_rows(cur, table: str, rows: List[tuple]) -> None:
+    columns, template = _INSERT_SPECS[table]
+    if len(rows) == 1:
+        _execute_prepared(cur, f"chimera_insert_{table}", rows[0])
+        return
+    if len(rows) >= _CFG.copy_threshold:
+        _copy_rows(cur, table, columns, rows)
+        return
+    execute_values(
+        cur,
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s",
+        rows,
+        template=template,
+        page_size=500,
+    )
+
+
+class _RetryLater(Exception):
+    """No pooled connection, or the connection failed mid-write: keep the rows and retry."""
+
+
+def _write_batch(table: str, rows: List[tuple]) -> None:
+    """
+    Write rows to table in one transaction on a pooled connection.
+
+    Raises:
+        _RetryLater: no connection available, or a connection-level error
+        psycopg2.Error: the rows themselves were rejected (e.g. DataError)
+    """
+    conn = get_db_connection()
+    if not conn:
+        raise _RetryLater("no pooled connection available")
+    try:
+        _ensure_schema(conn)
+        cur = conn.cursor()
+        _write_rows(cur, table, rows)
+        if table == "selector_repairs":
+            _notify_selector_repairs(cur, [row[1] for row in rows])
+        conn.commit()
+        cur.close()
     except Exception as e:
-        logger.error(f"❌ Failed to allocate hardware entropy: {e}")
         try:
             conn.rollback()
         except Exception:
             pass
+        if isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError)):
+            raise _RetryLater(str(e)) from e
+        raise
+    finally:
         return_db_connection(conn)
-        return None
+    if table == "selector_repairs":
+        # New repairs supersede cached heuristics (including cached misses)
+        for row in rows:
+            _heuristic_cache.pop(row[1])
+
+
+def _insert_rows(table: str, rows: List[tuple]) -> bool:
+    """Write rows inline (DB_ASYNC_INSERTS=0 path)."""
+    try:
+        _write_batch(table, rows)
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to insert {len(rows)} row(s) into {table}: {e}")
+        return False
+
+
+def _insert_verb() -> str:
+    return "queued" if _CFG.async_inserts else "logged"
+
+
+def _submit_row(table: str, row: tuple) -> bool:
+    """
+    Queue a row for the background flusher, or insert it inline when
+    DB_ASYNC_INSERTS=0.
+    
+    Queued rows survive DB outages (they are retried with backoff); the
+    row is rejected instead when the table's backlog is at DB_QUEUE_MAX.
+    
+    Returns:
+        True if inserted or accepted by the flusher, False otherwise
+    """
+    if not _CFG.async_inserts:
+        return _insert_rows(table, [row])
+    _start_flusher()
+    q = _INSERT_QUEUES[table]
+    if q.qsize() + len(_RETRY_ROWS[table]) >= _CFG.queue_max:
+        logger.error(f"❌ {table} insert backlog full ({_CFG.queue_max} rows) - row rejected")
+        return False
+    q.put(row)
+    if q.qsize() >= _CFG.copy_threshold:
+        _flush_wakeup.set()  # burst: flush now as one COPY
+    return True
+
+
+def _drain(q: "queue.Queue[tuple]", limit: int) -> List[tuple]:
+    rows: List[tuple] = []
+    while len(rows) < limit:
+        try:
+            rows.append(q.get_nowait())
+        except queue.Empty:
+            break
+    return rows
+
+
+def _next_batch(table: str) -> List[tuple]:
+    """Rows awaiting retry first (oldest first), then newly queued ones."""
+    retry = _RETRY_ROWS[table]
+    if retry:
+        return [retry.popleft() for _ in range(min(len(retry), _CFG.batch_max))]
+    return _drain(_INSERT_QUEUES[table], _CFG.batch_max)
+
+
+def _write_row_by_row(table: str, rows: List[tuple]) -> Tuple[int, List[tuple]]:
+    """
+    Isolate rejected rows after a batch failed on data: each row gets its own
+    transaction and only the ones the DB rejects are dropped.
+
+    Returns:
+        (rows written, rows left unwritten because the DB became unreachable)
+    """
+    written = 0
+    for i, row in enumerate(rows):
+        try:
+            _write_batch(table, [row])
+            written += 1
+        except _RetryLater:
+            return written, rows[i:]
+        except Exception as e:
+            logger.error(f"❌ Dropped rejected row for {table}: {e}")
+    return written, []
+
+
+def _defer_rows(table: str, rows: List[tuple], reason: Exception) -> None:
+    """Put rows back at the head of the table's retry list and back off the flusher."""
+    global _retry_delay, _retry_at
+    _RETRY_ROWS[table].extendleft(reversed(rows))
+    _retry_delay = min(max(_retry_delay * 2, _RETRY_BACKOFF_MIN_S), _RETRY_BACKOFF_MAX_S)
+    _retry_at = time.monotonic() + _retry_delay
+    logger.warning(
+        f"⚠️ DB write deferred ({reason}); {len(_RETRY_ROWS[table])} {table} row(s) kept, "
+        f"retrying in {_retry_delay:.1f}s"
+    )
+
+
+def flush_pending_inserts() -> int:
+    """
+    Flush every queued row now (also runs at interpreter exit).
+    
+    On a connection error the batch is kept for retry and flushing stops
+    until the backoff expires; when the DB rejects a batch's data, the
+    batch is retried row by row so only the offending rows are dropped.
+    
+    Returns:
+        Number of rows written
+    """
+    global _retry_delay
+    written = 0
+    # Serialized so a caller's flush also waits for a batch already in flight
+    with _flush_lock:
+        for table in _INSERT_QUEUES:
+            while True:
+                rows = _next_batch(table)
+                if not rows:
+                    break
+                try:
+                    _write_batch(table, rows)
+                    written += len(rows)
+                except _RetryLater as e:
+                    _defer_rows(table, rows, e)
+                    return written
+                except Exception as e:
+                    logger.warning(f"⚠️ Batch insert into {table} rejected ({e}); retrying row by row")
+                    done, leftover = _write_row_by_row(table, rows)
+                    written += done
+                    if leftover:
+                        _defer_rows(table, leftover, "connection lost during row-by-row retry")
+                        return written
+        _retry_delay = 0.0
+    return written
+
+
+def _pending_row_count() -> int:
+    return sum(q.qsize() + len(_RETRY_ROWS[t]) for t, q in _INSERT_QUEUES.items())
+
+
+def _flush_at_exit() -> None:
+    """atexit: one last flush attempt; report anything that could not be written."""
+    global _exit_flushed
+    if _exit_flushed:
+        return
+    _exit_flushed = True
+    flush_pending_inserts()
+    pending = _pending_row_count()
+    if pending:
+        logger.error(f"❌ Exiting with {pending} unwritten queued row(s) (database unreachable)")
+
+
+def _flusher_loop() -> None:
+    while True:
+        _flush_wakeup.wait(_CFG.flush_interval_ms / 1000.0)
+        _flush_wakeup.clear()
+        if time.monotonic() < _retry_at:
+            continue  # backing off after an outage
+        try:
+            flush_pending_inserts()
+        except Exception as e:
+            logger.error(f"❌ DB flusher error: {e}")
+
+
+def _start_flusher() -> None:
+    global _flusher_thread
+    if _flusher_thread is not None:
+        return
+    with _flusher_lock:
+        if _flusher_thread is None:
+            _flusher_thread = threading.Thread(target=_flusher_loop, name="chimera-db-flusher", daemon=True)
+            _flusher_thread.start()
+            atexit.register(_flush_at_exit)
 
 
 def record_stealth_check(
@@ -703,7 +1464,8 @@ def record_stealth_check(
         trace_url: Optional trace file URL
     
     Returns:
-        True if logged successfully, False otherwise
+        True if written (or queued for the flusher when DB_ASYNC_INSERTS=1),
+        False otherwise
     """
     return log_mission_result(
         worker_id=worker_id,
@@ -744,67 +1506,35 @@ def log_mission_result(
         error_message: Optional error message if validation failed
     
     Returns:
-        True if logged successfully, False otherwise
+        True if written (or queued for the flusher when DB_ASYNC_INSERTS=1),
+        False otherwise
     """
     if not DATABASE_URL:
         logger.debug("⚠️ DATABASE_URL not set - skipping mission result log")
         return False
     
-    conn = get_db_connection()
-    if not conn:
+    ok = _submit_row("mission_results", (
+        worker_id,
+        trust_score,
+        is_human,
+        validation_method,
+        _dumps_json(fingerprint_details) if fingerprint_details else None,
+        mission_type,
+        mission_status,
+        error_message,
+        trace_url,
+        _utcnow(),
+    ))
+    if not ok:
+        logger.error("❌ Failed to log mission result")
         return False
     
-    try:
-        ensure_mission_results_table(conn)
-        
-        cur = conn.cursor()
-        
-        # Insert mission result
-        cur.execute("""
-            INSERT INTO mission_results (
-                worker_id,
-                trust_score,
-                is_human,
-                validation_method,
-                fingerprint_details,
-                mission_type,
-                mission_status,
-                error_message,
-                trace_url,
-                completed_at
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
-        """, (
-            worker_id,
-            trust_score,
-            is_human,
-            validation_method,
-            psycopg2.extras.Json(fingerprint_details) if fingerprint_details else None,
-            mission_type,
-            mission_status,
-            error_message,
-            trace_url
-        ))
-        
-        conn.commit()
-        cur.close()
-        return_db_connection(conn)  # Return to pool instead of closing
-        
-        if is_human and trust_score >= 100.0:
-            logger.info(f"✅ Mission result logged: {worker_id} - {trust_score}% HUMAN")
-        else:
-            logger.warning(f"⚠️ Mission result logged: {worker_id} - {trust_score}% (NOT HUMAN)")
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"❌ Failed to log mission result: {e}")
-        if conn:
-            try:
-                conn.rollback()
-            except:
-                pass
-            return_db_connection(conn)  # Return to pool even on error
-        return False
+    if is_human and trust_score >= 100.0:
+        logger.info(f"✅ Mission result {_insert_verb()}: {worker_id} - {trust_score}% HUMAN")
+    else:
+        logger.warning(f"⚠️ Mission result {_insert_verb()}: {worker_id} - {trust_score}% (NOT HUMAN)")
+    
+    return True
 
 
 def test_db_connection() -> bool:
@@ -818,7 +1548,8 @@ def test_db_connection() -> bool:
         logger.warning("⚠️ DATABASE_URL not set - PostgreSQL persistence disabled")
         return False
     
-    conn = get_db_connection()
+    # Standalone bootstrap connection: the probe and schema DDL stay off the pool
+    conn = _bootstrap_connection()
     if not conn:
         return False
     
@@ -827,16 +1558,16 @@ def test_db_connection() -> bool:
         cur.execute("SELECT version();")
         version = cur.fetchone()[0]
         cur.close()
-        return_db_connection(conn)  # Return to pool instead of closing
+        _init_schema_once(conn)
         
         role = _infer_log_role()
         logger.info(f"✅ [{role}] Connected to PostgreSQL Persistence Layer")
         logger.debug(f"   PostgreSQL version: {version.split(',')[0]}")
-        logger.debug(f"   Connection pool: 2-10 connections (high-concurrency ready)")
+        logger.debug(f"   Connection pool: {_CFG.pool_min}-{_CFG.pool_max} connections (high-concurrency ready)")
         return True
         
     except Exception as e:
         logger.error(f"❌ PostgreSQL connection test failed: {e}")
-        if conn:
-            return_db_connection(conn)  # Return to pool even on error
         return False
+    finally:
+        conn.close()
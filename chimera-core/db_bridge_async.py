@@ -0,0 +1,246 @@
+"""
+Chimera Core - Async Database Bridge
+
+asyncpg-backed variants of the db_bridge writers for callers running on the
+worker event loop, so DB writes never stall it.
+
+Single-row writes go through asyncpg's per-connection prepared statement cache;
+bulk writes use binary COPY (copy_records_to_table). Falls back to the sync
+db_bridge functions on a thread when asyncpg isn't installed.
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Any, Dict, Iterable, Optional
+
+import db_bridge
+from db_bridge import DATABASE_URL
+
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[Any] = None
+_pool_lock: Optional[asyncio.Lock] = None
+
+
+async def get_async_pool():
+    """
+    Get or create the asyncpg pool.
+
+    Returns:
+        asyncpg.Pool or None if asyncpg/DATABASE_URL unavailable
+    """
+    global _pool, _pool_lock
+
+    if not ASYNCPG_AVAILABLE or not DATABASE_URL:
+        return None
+
+    if _pool is None:
+        if _pool_lock is None:
+            _pool_lock = asyncio.Lock()
+        async with _pool_lock:
+            if _pool is None:
+                try:
+                    _pool = await asyncpg.create_pool(
+                        dsn=DATABASE_URL,
+                        min_size=1,
+                        max_size=db_bridge._CFG.async_pool_max,
+                        timeout=db_bridge._CFG.connect_timeout,
+                        server_settings={"application_name": "chimera-core-async"},
+                    )
+                    logger.debug("✅ asyncpg pool created")
+                except Exception as e:
+                    logger.error(f"❌ Failed to create asyncpg pool: {e}")
+                    return None
+
+    return _pool
+
+
+async def close_async_pool() -> None:
+    """Close the asyncpg pool (call on shutdown)."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+async def _ensure_schema_async() -> None:
+    # DDL lives in db_bridge; run its one-time init on a thread the first time
+    if not db_bridge._schema_ready.is_set():
+        await asyncio.to_thread(db_bridge.init_schema)
+
+
+async def _notify_selector_repairs(conn, selectors) -> None:
+    # Same channel/payload rules as db_bridge so every process's cache listener sees it
+    for payload in db_bridge._repair_payloads(selectors):
+        await conn.execute("SELECT pg_notify($1, $2)", db_bridge._REPAIR_CHANNEL, payload)
+
+
+async def _insert_one(table: str, row: tuple) -> bool:
+    """Insert one row (statement is prepared once per connection by asyncpg)."""
+    pool = await get_async_pool()
+    if pool is None:
+        return False
+    columns, template = db_bridge._INSERT_SPECS[table]
+    # Reuse the psycopg2 template's casts (e.g. ::jsonb) with $n placeholders
+    placeholders = ", ".join(
+        f"${i + 1}{part[2:]}" for i, part in enumerate(template.strip("()").split(", "))
+    )
+    try:
+        await _ensure_schema_async()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                    *row,
+                )
+                if table == "selector_repairs":
+                    await _notify_selector_repairs(conn, [row[1]])
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to insert into {table} (async): {e}")
+        return False
+
+
+async def copy_rows_async(table: str, rows: Iterable[tuple]) -> bool:
+    """
+    Bulk load rows into one of the batched tables with binary COPY.
+
+    Args:
+        table: mission_results, selector_repairs or hardware_entropy
+        rows: Tuples in db_bridge._INSERT_SPECS column order (naive UTC timestamps)
+
+    Returns:
+        True if loaded successfully, False otherwise
+    """
+    rows = list(rows)
+    if not rows:
+        return True
+    pool = await get_async_pool()
+    if pool is None:
+        return False
+    columns, _ = db_bridge._INSERT_SPECS[table]
+    try:
+        await _ensure_schema_async()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.copy_records_to_table(table, records=rows, columns=list(columns))
+                if table == "selector_repairs":
+                    await _notify_selector_repairs(conn, [row[1] for row in rows])
+        if table == "selector_repairs":
+            for row in rows:
+                db_bridge._heuristic_cache.pop(row[1])
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to COPY {len(rows)} row(s) into {table}: {e}")
+        return False
+
+
+async def log_mission_result_async(
+    worker_id: str,
+    trust_score: float,
+    is_human: bool,
+    validation_method: str = "creepjs",
+    fingerprint_details: Optional[Dict[str, Any]] = None,
+    mission_type: Optional[str] = None,
+    mission_status: str = "completed",
+    error_message: Optional[str] = None,
+    trace_url: Optional[str] = None
+) -> bool:
+    """
+    Async variant of db_bridge.log_mission_result.
+
+    Returns:
+        True if logged successfully, False otherwise
+    """
+    if not ASYNCPG_AVAILABLE:
+        return await asyncio.to_thread(
+            db_bridge.log_mission_result,
+            worker_id, trust_score, is_human, validation_method, fingerprint_details,
+            mission_type, mission_status, error_message, trace_url,
+        )
+    if not DATABASE_URL:
+        logger.debug("⚠️ DATABASE_URL not set - skipping mission result log")
+        return False
+
+    ok = await _insert_one("mission_results", (
+        worker_id,
+        trust_score,
+        is_human,
+        validation_method,
+        db_bridge._dumps_json(fingerprint_details) if fingerprint_details else None,
+        mission_type,
+        mission_status,
+        error_message,
+        trace_url,
+        db_bridge._utcnow(),
+    ))
+    if ok:
+        if is_human and trust_score >= 100.0:
+            logger.info(f"✅ Mission result logged: {worker_id} - {trust_score}% HUMAN")
+        else:
+            logger.warning(f"⚠️ Mission result logged: {worker_id} - {trust_score}% (NOT HUMAN)")
+    return ok
+
+
+async def log_selector_repair_async(
+    worker_id: str,
+    original_selector: str,
+    new_selector: str,
+    method: str = "isomorphic",
+    confidence: float = 0.85,
+    intent: Optional[str] = None
+) -> bool:
+    """
+    Async variant of db_bridge.log_selector_repair.
+
+    Returns:
+        True if logged successfully, False otherwise
+    """
+    if not ASYNCPG_AVAILABLE:
+        return await asyncio.to_thread(
+            db_bridge.log_selector_repair,
+            worker_id, original_selector, new_selector, method, confidence, intent,
+        )
+    if not DATABASE_URL:
+        logger.debug("⚠️ DATABASE_URL not set - skipping selector repair log")
+        return False
+
+    ok = await _insert_one("selector_repairs", (
+        worker_id, original_selector, new_selector, method, confidence, intent, db_bridge._utcnow(),
+    ))
+    if ok:
+        db_bridge._heuristic_cache.pop(original_selector)
+        logger.info("✅ Selector self-healed and updated in Postgres")
+    return ok
+
+
+async def allocate_hardware_entropy_async(worker_id: str, mission_id: Optional[str] = None) -> Optional[Dict[str, int]]:
+    """
+    Async variant of db_bridge.allocate_hardware_entropy.
+
+    Returns:
+        {"gpu_seed": int, "audio_seed": int, "canvas_seed": int} or None
+    """
+    if not ASYNCPG_AVAILABLE:
+        return await asyncio.to_thread(db_bridge.allocate_hardware_entropy, worker_id, mission_id)
+    if not DATABASE_URL:
+        logger.critical("❌ NO DATABASE_URL OR APP_DATABASE_URL FOUND")
+        return None
+
+    mission_id = mission_id or f"mission-{uuid.uuid4()}"
+    gpu_seed, audio_seed, canvas_seed = db_bridge._take_entropy_seeds()
+
+    ok = await _insert_one("hardware_entropy", (
+        worker_id, mission_id, gpu_seed, audio_seed, canvas_seed, db_bridge._utcnow(),
+    ))
+    if not ok:
+        return None
+    logger.info(f"🧬 Hardware entropy allocated for mission: {mission_id}")
+    return {"gpu_seed": gpu_seed, "audio_seed": audio_seed, "canvas_seed": canvas_seed}
@@ -8,12 +8,14 @@ you are a "User" with a history.
 
 import asyncio
 import logging
+import os
 import random
+import time
 
 logger = logging.getLogger(__name__)
 
 # Benign news/social sites for warmup (session trust)
-WARMUP_URLS = [
+WARMUP_URLS = (
     "https://www.bbc.com/news",
     "https://www.reuters.com",
     "https://www.npr.org",
@@ -24,29 +26,48 @@ WARMUP_URLS = [
     "https://www.nytimes.com",
     "https://www.reddit.com",
     "https://www.wikipedia.org",
-]
+)
 
 WARMUP_DURATION_MIN = 30
 WARMUP_DURATION_MAX = 60
 
+# Per-process RNG: keeps warmup draws off the shared module-level Random.
+# Seeded with pid/time too so replicas sharing WORKER_ID still diverge.
+_RNG = random.Random(f"{os.getenv('WORKER_ID', 'default')}:{os.getpid()}:{time.time_ns()}")
+
+
+# Warmup pacing: one tick per second, a wheel scroll every few ticks
+_WARMUP_SCROLL_EVERY = 5
+
 
 async def perform_warmup(worker) -> None:
     """
     Navigate to a random news/social site for 30-60s before starting a mission.
     Builds session trust: you are a "User" with a history, not a fresh visitor.
+
+    The dwell is spent scrolling like a reader rather than idling.
     """
     page = getattr(worker, "_page", None)
     if not page:
         logger.debug("perform_warmup: no page, skip")
         return
 
-    url = random.choice(WARMUP_URLS)
-    duration = random.uniform(WARMUP_DURATION_MIN, WARMUP_DURATION_MAX)
+    url = _RNG.choice(WARMUP_URLS)
+    duration = _RNG.uniform(WARMUP_DURATION_MIN, WARMUP_DURATION_MAX)
 
     try:
         await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-        # Simulate reading: stay 30-60s
-        await asyncio.sleep(duration)
+        # Simulate reading: stay 30-60s, scrolling as we go
+        start = time.monotonic()
+        tick = 0
+        while True:
+            remaining = duration - (time.monotonic() - start)
+            if remaining <= 0:
+                break
+            if tick % _WARMUP_SCROLL_EVERY == 0:
+                await page.mouse.wheel(0, _RNG.randint(200, 600))
+            tick += 1
+            await asyncio.sleep(min(1.0, remaining))
         logger.info("Ghost warmup done: %s for %.1fs", url, duration)
     except Exception as e:
         logger.debug("Ghost warmup failed (non-fatal): %s", e)
@@ -57,7 +57,8 @@ class DiffusionMouse:
         if t < 0.5:
             return 4 * t * t * t
         else:
-            return 1 - pow(-2 * t + 2, 3) / 2
+            u = 2.0 - 2.0 * t
+            return 1.0 - 0.5 * u * u * u
     
     def generate_path(
         self, 
@@ -213,8 +213,8 @@ async def run_worker_swarm(workers: list):
                 
                 # Phase 2: Record stealth check to PostgreSQL (using connection pool)
                 # Phase 4: Include trace URL in mission result
-                from db_bridge import log_mission_result
-                log_mission_result(
+                from db_bridge_async import log_mission_result_async
+                await log_mission_result_async(
                     worker_id=workers[0].worker_id,
                     trust_score=result['trust_score'],
                     is_human=True,
@@ -423,11 +423,10 @@ async def run_worker_swarm(workers: list):
                         logger.warning(f"LPUSH chimera:results failed: {e}")
                     if os.getenv("BRAINSCRAPER_URL"):
                         try:
-                            from telemetry_client import TelemetryClient
-                            tc = TelemetryClient()
+                            from telemetry_client import get_telemetry_client
+                            tc = get_telemetry_client()
                             screenshot = await worker.take_screenshot()
-                            await asyncio.to_thread(
-                                tc.push,
+                            tc.push_nowait(
                                 mission_id=mission_id,
                                 screenshot=screenshot,
                                 vision_confidence=result.get("vision_confidence"),
@@ -463,6 +462,17 @@ async def run_worker_swarm(workers: list):
                         )
                     except Exception as lerr:
                         logger.warning(f"LPUSH {key} on timeout failed: {lerr}")
+                    if os.getenv("BRAINSCRAPER_URL"):
+                        try:
+                            from telemetry_client import get_telemetry_client
+                            get_telemetry_client().push_nowait(
+                                mission_id=mission_id,
+                                status="failed",
+                                trauma_signals=["MISSION_TIMEOUT"],
+                                trauma_details=f"mission_timeout_{mission_timeout}s",
+                            )
+                        except Exception as te:
+                            logger.debug("Telemetry push (timeout) skipped: %s", te)
                 try:
                     await asyncio.to_thread(r.hset, f"mission:{mission_id}", mapping={
                         "status": "timeout", "trauma_signals": json.dumps(["MISSION_TIMEOUT"]),
@@ -486,10 +496,9 @@ async def run_worker_swarm(workers: list):
                         logger.warning(f"[ChimeraCore] LPUSH {key} failed: {lerr} — Scrapegoat may BRPOP timeout")
                     if os.getenv("BRAINSCRAPER_URL"):
                         try:
-                            from telemetry_client import TelemetryClient
-                            tc = TelemetryClient()
-                            await asyncio.to_thread(
-                                tc.push,
+                            from telemetry_client import get_telemetry_client
+                            tc = get_telemetry_client()
+                            tc.push_nowait(
                                 mission_id=mission_id,
                                 status="failed",
                                 trauma_signals=["CHIMERA_FAILED"],
@@ -565,10 +574,24 @@ async def main_async():
     except Exception as e:
         logger.error(f"❌ Failed to start worker swarm: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        # Drain batched/in-flight telemetry pushes before the loop goes away
+        from telemetry_client import close_telemetry_client
+        await close_telemetry_client()
+        # Release asyncpg connections (no-op when the pool was never created)
+        from db_bridge_async import close_async_pool
+        await close_async_pool()
 
 
 def main():
     """Main entry point for Chimera Core worker"""
+    # uvloop: cheaper event-loop wakeups for the many short sleeps in mouse/scroll paths
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("⚡ uvloop event loop policy installed")
+    except ImportError:
+        logger.debug("uvloop not installed; using default asyncio event loop")
     try:
         asyncio.run(main_async())
     except KeyboardInterrupt:
@@ -6,35 +6,145 @@ process_vision to ground each "Intent" onto the current screen. Example: if
 the Blueprint says "Find the primary action button," the VLM returns coordinates.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Final, List, Optional, Sequence, Tuple
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Per-worker grounding memo size (entries of (frame hash, description) -> Ground)
+_GROUND_CACHE_MAX = 256
+
+# Default cap on concurrent VLM calls per blueprint so a large blueprint
+# saturates the Brain without swamping it
+_DEFAULT_MAX_IN_FLIGHT = 8
+
+
+async def _screenshot(worker: Any) -> bytes:
+    # Reuse the worker's memoized frame when nothing has changed since it was taken
+    cached = getattr(worker, "get_cached_screenshot", None)
+    if cached is not None:
+        return await cached(max_age_ms=250)
+    return await worker.take_screenshot()
+
+
+async def _click_with_jitter(
+    page: Any, x: float, y: float, prev: Optional[asyncio.Event], done: asyncio.Event
+) -> None:
+    # Humanization delays overlap across intents; the clicks themselves run
+    # one at a time in blueprint (intent) order: each waits for the previous
+    # intent's click to finish, whichever jitter happened to expire first
+    try:
+        await asyncio.sleep(random.uniform(0.010, 0.040))
+        if prev is not None:
+            await prev.wait()
+        await page.mouse.click(x, y)
+    finally:
+        done.set()
+
+
+@dataclass(frozen=True, slots=True)
+class Ground:
+    """One intent grounded on a frame, parsed once at the VLM boundary."""
+
+    found: bool
+    x: Optional[float] = None
+    y: Optional[float] = None
+    confidence: Optional[float] = None
+    drift: bool = False
+
+    @classmethod
+    def from_coords(cls, coords: Optional[Dict[str, Any]]) -> "Ground":
+        if not coords:
+            return _FAIL
+        return cls(
+            bool(coords.get("found")),
+            coords.get("x"),
+            coords.get("y"),
+            coords.get("confidence"),
+            bool(coords.get("coordinate_drift", False)),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "found": self.found,
+            "x": self.x,
+            "y": self.y,
+            "confidence": self.confidence,
+            "coordinate_drift": self.drift,
+        }
+
+
+# Shared miss result (Ground is immutable), so failure paths allocate nothing
+_FAIL: Final[Ground] = Ground(False)
+
+
+def _frame_key(shot: bytes) -> int:
+    # Cheap 64-bit digest of the encoded frame; identical pages encode identically
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(shot)
+    return hash(shot)
 
-async def ground_intent(worker: Any, description: str, context: str = "semantic") -> Dict[str, Any]:
+
+def _cache_get(cache: Any, key: Tuple[int, str]) -> Optional[Ground]:
+    hit = cache.get(key)
+    if hit is not None:
+        cache.move_to_end(key)
+    return hit
+
+
+def _cache_put(cache: Any, key: Tuple[int, str], ground: Ground) -> None:
+    cache[key] = ground
+    cache.move_to_end(key)
+    if len(cache) > _GROUND_CACHE_MAX:
+        cache.popitem(last=False)
+
+
+async def ground_intent(
+    worker: Any,
+    description: str,
+    context: str = "semantic",
+    shot: Optional[bytes] = None,
+    *,
+    enable_cache: bool = True,
+) -> Ground:
     """
     Use Chimera Brain VLM to ground one intent onto the current screen.
-    Returns { "x", "y", "found", "confidence", "coordinate_drift" }.
+    Pass shot to reuse a screenshot already captured for this frame. With
+    enable_cache, an intent already grounded on an identical frame is answered
+    from the worker's grounding cache without a VLM call.
+    Returns a Ground (use .to_dict() for the JSON shape).
     """
     page = getattr(worker, "_page", None)
     if not page:
-        return {"found": False, "x": None, "y": None}
+        return _FAIL
     try:
-        shot = await worker.take_screenshot()
+        if shot is None:
+            shot = await _screenshot(worker)
+        cache = getattr(worker, "_ground_cache", None) if enable_cache else None
+        if cache is not None:
+            key = (_frame_key(shot), description)
+            hit = _cache_get(cache, key)
+            if hit is not None:
+                return hit
         coords = await worker.process_vision(shot, context=context, text_command=description)
-        if not coords:
-            return {"found": False, "x": None, "y": None}
-        return {
-            "found": bool(coords.get("found")),
-            "x": coords.get("x"),
-            "y": coords.get("y"),
-            "confidence": coords.get("confidence"),
-            "coordinate_drift": coords.get("coordinate_drift", False),
-        }
+        ground = Ground.from_coords(coords)
+        # None means the Brain was unreachable, not a real answer; don't memoize it
+        if cache is not None and coords is not None:
+            _cache_put(cache, key, ground)
+        return ground
     except Exception as e:
-        logger.debug("semantic ground_intent %s: %s", description[:40], e)
-        return {"found": False, "x": None, "y": None}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("semantic ground_intent %s: %s", description[:40], e)
+        return _FAIL
 
 
 async def run_semantic_blueprint(
@@ -42,27 +152,100 @@ async def run_semantic_blueprint(
     semantic_blueprint: Dict[str, Any],
     *,
     click_on_found: bool = False,
+    enable_cache: bool = True,
+    max_in_flight: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
-    Run a Semantic Blueprint: for each intent, call the VLM to ground it.
-    Optionally click on found coordinates. Returns a map intent_id -> {x, y, found, ...}.
+    Run a Semantic Blueprint: ground every intent against one screenshot in a
+    single batched VLM submission. Optionally click on found coordinates.
+    With enable_cache, only intents not already grounded on an identical frame
+    go to the VLM. At most max_in_flight (default 8) VLM calls run at once.
+    Returns a map intent_id -> {x, y, found, ...}.
     """
-    intents: List[Dict[str, Any]] = semantic_blueprint.get("intents") or []
-    out: Dict[str, Any] = {}
+    intents: Sequence[Dict[str, Any]] = semantic_blueprint.get("intents") or ()
+    if not intents:
+        return {"intents": {}}
 
+    # Preflight: drop description-less (template) intents once, up front
+    ids: List[str] = []
+    descs: List[str] = []
     for it in intents:
-        iid = it.get("id") or "unknown"
-        desc = it.get("description") or ""
-        if not desc:
-            continue
-        r = await ground_intent(worker, desc, context="semantic_blueprint")
-        out[iid] = r
-        if click_on_found and r.get("found") and r.get("x") is not None and r.get("y") is not None:
-            try:
-                page = getattr(worker, "_page", None)
-                if page:
-                    await page.mouse.click(float(r["x"]), float(r["y"]))
-            except Exception as e:
-                logger.debug("semantic click %s: %s", iid, e)
-
-    return {"intents": out}
+        desc = it.get("description")
+        if desc:
+            ids.append(it.get("id") or "unknown")
+            descs.append(desc)
+    if not descs:
+        return {"intents": {}}
+
+    # One screenshot for the whole blueprint; intents are grounded on the same frame
+    shot = None
+    if getattr(worker, "_page", None):
+        try:
+            shot = await _screenshot(worker)
+        except Exception as e:
+            logger.debug("semantic screenshot: %s", e)
+
+    results: List[Ground] = [_FAIL] * len(descs)
+    cache = getattr(worker, "_ground_cache", None) if enable_cache and shot is not None else None
+    pending = list(range(len(descs)))
+    if cache is not None:
+        frame = _frame_key(shot)
+        pending = []
+        for i, desc in enumerate(descs):
+            hit = _cache_get(cache, (frame, desc))
+            if hit is None:
+                pending.append(i)
+            else:
+                results[i] = hit
+
+    limit = max_in_flight or _DEFAULT_MAX_IN_FLIGHT
+    batch = getattr(worker, "process_vision_batch", None)
+    if shot is not None and pending and batch is not None:
+        try:
+            coords = await batch(shot, "semantic_blueprint", [descs[i] for i in pending], limit)
+            for i, c in zip(pending, coords):
+                results[i] = Ground.from_coords(c)
+                if cache is not None and c is not None:
+                    _cache_put(cache, (frame, descs[i]), results[i])
+        except Exception as e:
+            logger.debug("semantic batch grounding: %s", e)
+    elif shot is not None and pending:
+        sem = asyncio.Semaphore(limit)
+
+        async def _one(desc: str) -> Ground:
+            async with sem:
+                return await ground_intent(
+                    worker, desc, context="semantic_blueprint", shot=shot, enable_cache=enable_cache
+                )
+
+        grounded = await asyncio.gather(*[_one(descs[i]) for i in pending])
+        for i, g in zip(pending, grounded):
+            results[i] = g
+
+    out = dict(zip(ids, results))
+
+    if click_on_found:
+        page = getattr(worker, "_page", None)
+        targets = [
+            (iid, float(r.x), float(r.y))
+            for iid, r in out.items()
+            if r.found and r.x is not None and r.y is not None
+        ]
+        if page and targets:
+            done = [asyncio.Event() for _ in targets]
+            outcomes = await asyncio.gather(
+                *[
+                    _click_with_jitter(page, x, y, done[i - 1] if i else None, done[i])
+                    for i, (_, x, y) in enumerate(targets)
+                ],
+                return_exceptions=True,
+            )
+            invalidate = getattr(worker, "invalidate_screenshot", None)
+            if invalidate is not None:
+                invalidate()
+            if logger.isEnabledFor(logging.DEBUG):
+                failed = [(t[0], e) for t, e in zip(targets, outcomes) if isinstance(e, BaseException)]
+                if failed:
+                    logger.debug("semantic click failed for %d intent(s), first %s: %s", len(failed), *failed[0])
+
+    return {"intents": {iid: r.to_dict() for iid, r in out.items()}}
@@ -15,16 +15,32 @@ import threading
 import os
 import time
 import hashlib
-from typing import Dict, Any, Optional, List, Tuple
+import functools
+import string
+import types
+import weakref
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
+
+import numpy as np
 from playwright.async_api import Page
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-_runtime_fatigue_lock = threading.Lock()
+# Shared generator for bulk noise draws (one C-level call per series, not per sample)
+_rng = np.random.default_rng()
+
+# Single float rebound atomically under the GIL; readers never need a lock
 _runtime_fatigue_jitter_multiplier = 1.0
 
-_tremor_lock = threading.Lock()
+# Log-debounce timestamps; read/written without a lock (a racing duplicate
+# "Micro-tremor active" line is harmless)
 _tremor_log_t = 0.0
 _tremor_move_log_t = 0.0
 
@@ -39,60 +55,86 @@ def inject_micro_tremor() -> Tuple[float, float]:
     freq = 8.0 + random.random() * 4.0
     phase = random.random() * math.tau
     amp = 0.08 + random.random() * 0.18  # sub-pixel amplitude
-    tremor = math.sin((math.tau * freq * now) + phase) * amp
-    tremor_y = math.cos((math.tau * (freq + 0.7) * now) + phase) * amp
+    # One angle per tick; y runs 0.7Hz faster, i.e. the same angle advanced by 0.7·ωt
+    omega_now = math.tau * now
+    angle = omega_now * freq + phase
+    tremor = math.sin(angle) * amp
+    tremor_y = math.cos(angle + 0.7 * omega_now) * amp
 
-    with _tremor_lock:
-        if now - _tremor_log_t > 3.0:
-            _tremor_log_t = now
-            logger.info("Micro-tremor active")
+    if now - _tremor_log_t > 3.0:
+        _tremor_log_t = now
+        logger.info("Micro-tremor active")
 
     return tremor, tremor_y
 
 
-async def force_kernel_rendering(
-    page: Page,
-    hardware_id: str,
-    platform: str,
-) -> None:
+def _micro_tremor_batch(times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Vanguard v2.0: Inject OS-specific kernel rendering hints.
+    Vectorized inject_micro_tremor: one (x, y) sub-pixel tremor per scheduled
+    monotonic timestamp, with per-point frequency/phase/amplitude drawn in bulk.
     """
-    platform_key = (platform or "").lower()
-    if "mac" in platform_key:
-        css = """
+    freq, phase, amp = _rng.random((3, len(times)))
+    freq = 8.0 + freq * 4.0
+    phase *= math.tau
+    amp = 0.08 + amp * 0.18  # sub-pixel amplitude
+    omega_t = math.tau * times
+    angle = omega_t * freq + phase
+    return np.sin(angle) * amp, np.cos(angle + 0.7 * omega_t) * amp
+
+
+# OS-specific font rendering hints for force_kernel_rendering
+_KERNEL_CSS = {
+    "mac": """
             html, body {
                 -webkit-font-smoothing: antialiased !important;
                 -moz-osx-font-smoothing: grayscale !important;
                 text-rendering: optimizeLegibility !important;
             }
-        """
-    elif "win" in platform_key:
-        css = """
+        """,
+    "win": """
             html, body {
                 text-rendering: optimizeLegibility !important;
                 font-smooth: always !important;
                 -webkit-text-stroke: 0.25px transparent !important;
             }
-        """
-    else:
-        css = """
+        """,
+    "_default": """
             html, body {
                 text-rendering: geometricPrecision !important;
                 -webkit-font-smoothing: antialiased !important;
             }
-        """
+        """,
+}
 
-    await page.add_init_script(
-        f"""
-        (() => {{
+# Init scripts pre-built per platform; only hardware_id is substituted per page
+_KERNEL_RENDER_SCRIPTS = {
+    key: string.Template(
+        """
+        (() => {
           const style = document.createElement('style');
-          style.setAttribute('data-kernel-render', '{hardware_id}');
-          style.textContent = `{css}`;
+          style.setAttribute('data-kernel-render', '${hardware_id}');
+          style.textContent = `"""
+        + css.replace("$", "$$")
+        + """`;
           document.documentElement.appendChild(style);
-        }})();
+        })();
         """
     )
+    for key, css in _KERNEL_CSS.items()
+}
+
+
+async def force_kernel_rendering(
+    page: Page,
+    hardware_id: str,
+    platform: str,
+) -> None:
+    """
+    Vanguard v2.0: Inject OS-specific kernel rendering hints.
+    """
+    platform_key = (platform or "").lower()
+    key = "mac" if "mac" in platform_key else "win" if "win" in platform_key else "_default"
+    await page.add_init_script(_KERNEL_RENDER_SCRIPTS[key].substitute(hardware_id=hardware_id))
     logger.info("Kernel rendering matched")
 
 
@@ -116,21 +158,21 @@ def compute_fatigue_multipliers(count: int) -> Tuple[float, float]:
 
 
 def set_fatigue_jitter_multiplier(multiplier: float) -> None:
-    """Set runtime jitter multiplier (thread-safe)."""
+    """Set runtime jitter multiplier (thread-safe: one global rebind)."""
     global _runtime_fatigue_jitter_multiplier
-    with _runtime_fatigue_lock:
-        _runtime_fatigue_jitter_multiplier = max(1.0, float(multiplier))
+    _runtime_fatigue_jitter_multiplier = max(1.0, float(multiplier))
 
 
 def get_fatigue_jitter_multiplier() -> float:
-    """Get runtime jitter multiplier (thread-safe)."""
-    with _runtime_fatigue_lock:
-        return float(_runtime_fatigue_jitter_multiplier)
+    """Get runtime jitter multiplier (thread-safe: one global read)."""
+    return _runtime_fatigue_jitter_multiplier
 
 
+@functools.lru_cache(maxsize=1)
 def _infer_log_role() -> str:
     """
     Determine whether we are running as BODY or SWARM for branded signatures.
+    Resolved once per process (env is fixed); _infer_log_role.cache_clear() resets it.
     """
     explicit = os.getenv("CHIMERA_LOG_TAG")
     if explicit:
@@ -163,8 +205,13 @@ class ThermalModel:
         dt = max(0.0, now - self.last_t)
         self.last_t = now
         # Exponential cooling: larger tau => slower cooling.
+        # For dt < tau/10 the first-order 1 - dt/tau is within 0.5% of exp(-dt/tau)
         tau = 75.0
-        if dt > 0:
+        if dt <= 0:
+            return
+        if dt < 7.5:
+            self.heat *= 1.0 - dt / tau
+        else:
             self.heat *= math.exp(-dt / tau)
 
     def apply_load(self, intensity: float, duration_s: float) -> float:
@@ -194,6 +241,10 @@ class ThermalModel:
 _thermal_lock = threading.Lock()
 _thermal_model = ThermalModel()
 
+# Micro-lags start at 66°C; below this heat even the max +0.35 wobble can't get
+# there (37 + heat·16.5 + 0.35 < 66), so thermal_extra_delay_s can skip the lock
+_THERMAL_LAG_MIN_HEAT = (66.0 - 37.0 - 0.35) / 16.5
+
 
 def thermal_mark_mission_start(intensity: float = 1.0) -> float:
     with _thermal_lock:
@@ -214,6 +265,11 @@ def thermal_extra_delay_s() -> float:
     """
     Return a micro-lag delay (3-12ms) when hot, else 0.
     """
+    # Lockless fast path for the common cold case; a read racing a concurrent
+    # bump just picks up the new heat on the next step
+    if _thermal_model.heat < _THERMAL_LAG_MIN_HEAT:
+        return 0.0
+
     with _thermal_lock:
         temp = _thermal_model.current_temp_c()
 
@@ -226,24 +282,91 @@ def thermal_extra_delay_s() -> float:
     return random.uniform(0.003, 0.012) * scale
 
 
-def inject_execution_noise(tag: str = "interaction") -> None:
+async def inject_execution_noise(tag: str = "interaction") -> None:
     """
-    Phase 9: Execution entropy injection (micro-calculations).
+    Phase 9: Execution entropy injection (timing jitter).
+
+    Yields to the event loop for a random 0.1-0.4ms instead of burning CPU on
+    throwaway math, so the interaction timestamp is still perturbed without
+    blocking other coroutines.
     """
     role = _infer_log_role()
-    start = time.perf_counter()
-    rounds = random.randint(12, 24)
-    acc = 0.0
-    samples = [random.random() for _ in range(rounds)]
-    for i, v in enumerate(samples, 1):
-        acc += math.sin(v * math.pi) * math.cos((i + 1) * v)
-        acc = (acc * 1.0000001) % 1.0
-    random.shuffle(samples)
-    _ = sorted(samples)
-    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    elapsed_ms = float(_rng.uniform(0.1, 0.4))
+    await asyncio.sleep(elapsed_ms / 1000.0)
     logger.info(f"✅ [{role}] Execution entropy active: {tag} ({elapsed_ms:.1f}ms)")
 
 
+@functools.lru_cache(maxsize=8)
+def _diffusion_t_tables(steps: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-`steps` tables for DiffusionMouse paths that don't depend on the
+    endpoints: Bernstein basis rows (4 x steps+1), the per-step saccadic
+    tremor sigma (before fatigue scaling) and the Fitts's Law delay curve.
+    Arrays are read-only because they are shared between calls.
+    """
+    t = np.linspace(0.0, 1.0, steps + 1)
+    u = 1.0 - t
+    basis = np.vstack((u * u * u, 3.0 * u * u * t, 3.0 * u * t * t, t * t * t))
+
+    # Fitts's Law: Velocity curve (Ease-In-Out)
+    # Slow at start and end, fast in middle
+    # Smoothstep 3t² - 2t³: branchless, C¹-continuous and monotonic like the
+    # piecewise ease-in/ease-out quad, without evaluating both halves
+    ease_t = t * t * (3.0 - 2.0 * t)
+
+    # VANGUARD: Saccadic Tremors - High-frequency jitter tied to velocity;
+    # velocity_factor peaks at mid-trajectory (ease_t is already in [0, 1])
+    velocity_factor = 1.0 - np.abs(2.0 * ease_t - 1.0)
+    tremor_amplitude = 0.3 + velocity_factor * 0.4  # 0.3-0.7px base
+    tremor_frequency = (1.0 + velocity_factor * 2.0).astype(np.int64)  # 1-3 draws
+    # k independent N(0, a²) draws sum to one N(0, k·a²) draw
+    tremor_sigma = tremor_amplitude * np.sqrt(tremor_frequency)
+
+    # Delay based on ease curve (faster in middle)
+    base_delay = 5  # ms per step
+    delay_ms = base_delay + (1 - ease_t) * 10  # 5-15ms range
+
+    for arr in (basis, tremor_sigma, delay_ms):
+        arr.setflags(write=False)
+    return basis, tremor_sigma, delay_ms
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _bezier_path_core(start_x, start_y, end_x, end_y, mid_x, mid_y, steps, jitter, familiarity):
+        """Native DiffusionMouse kernel: Horner Bezier + smoothstep ease + tremor noise (same math as the NumPy path)."""
+        n = steps + 1
+        xs = np.empty(n)
+        ys = np.empty(n)
+        delays = np.empty(n)
+        p1x = start_x + (mid_x - start_x) * 0.3
+        p1y = start_y + (mid_y - start_y) * 0.3
+        p2x = end_x + (mid_x - end_x) * 0.3
+        p2y = end_y + (mid_y - end_y) * 0.3
+        # Power-basis coefficients, hoisted out of the loop: P(t) = ((A·t + B)·t + C)·t + D
+        ax = end_x - start_x + 3.0 * (p1x - p2x)
+        bx = 3.0 * (start_x - 2.0 * p1x + p2x)
+        cx = 3.0 * (p1x - start_x)
+        ay = end_y - start_y + 3.0 * (p1y - p2y)
+        by = 3.0 * (start_y - 2.0 * p1y + p2y)
+        cy = 3.0 * (p1y - start_y)
+        tremor_scale = max(0.8, min(2.2, jitter))
+        speed = 0.85 if familiarity else 1.0
+        for i in range(n):
+            t = i / steps
+            ease_t = t * t * (3.0 - 2.0 * t)
+            velocity_factor = 1.0 - abs(2.0 * ease_t - 1.0)
+            amp = (0.3 + velocity_factor * 0.4) * tremor_scale
+            k = int(1.0 + velocity_factor * 2.0)
+            sigma = math.sqrt(jitter * jitter + k * amp * amp)
+            xs[i] = ((ax * t + bx) * t + cx) * t + start_x + np.random.standard_normal() * sigma
+            ys[i] = ((ay * t + by) * t + cy) * t + start_y + np.random.standard_normal() * sigma
+            delays[i] = (5.0 + (1.0 - ease_t) * 10.0) * speed
+        return xs, ys, delays
+else:
+    _bezier_path_core = None
+
+
 class DiffusionMouse:
     """
     Native-level biological mouse movement simulation.
@@ -252,7 +375,7 @@ class DiffusionMouse:
     - Non-linear cubic Bezier paths for every mouse move (no linear interpolation)
     - 1px Gaussian noise to every path coordinate (hand tremors)
     - Saccadic tremors: extra Gaussian per point, scaled by velocity and fatigue
-    - inject_micro_tremor() (8–12 Hz sub-pixel) at each step in move_to
+    - 8–12 Hz sub-pixel micro-tremor (inject_micro_tremor, batched per path) at each step in move_to
     - Fitts's Law velocity curves (ease-in-out)
     """
     
@@ -263,7 +386,7 @@ class DiffusionMouse:
         steps: int = 30,
         jitter: float = 1.0,  # 1px Gaussian noise as specified
         familiarity: bool = False
-    ) -> List[Tuple[float, float, float]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Generate Bezier curve path with 1px Gaussian noise.
         
@@ -274,76 +397,43 @@ class DiffusionMouse:
             jitter: Gaussian noise amplitude (1px as per spec)
         
         Returns:
-            List of (x, y, delay_ms) tuples
+            (xs, ys, delays_ms) parallel float64 arrays of length steps + 1
+            (delays_ms may be a shared read-only table; don't mutate it)
         """
         # Control points for Bezier curve (creates natural arc)
         curvature_scale = 0.6 if familiarity else 1.0
-        mid_x = (start[0] + end[0]) / 2 + random.uniform(-50, 50) * curvature_scale
-        mid_y = (start[1] + end[1]) / 2 + random.uniform(-30, 30) * curvature_scale
-        
-        path = []
-        
-        for i in range(steps + 1):
-            t = i / steps
-            
-            # Cubic Bezier curve (4 control points)
-            # P(t) = (1-t)³P₀ + 3(1-t)²tP₁ + 3(1-t)t²P₂ + t³P₃
-            x = (
-                (1 - t) ** 3 * start[0] +
-                3 * (1 - t) ** 2 * t * (start[0] + (mid_x - start[0]) * 0.3) +
-                3 * (1 - t) * t ** 2 * (end[0] + (mid_x - end[0]) * 0.3) +
-                t ** 3 * end[0]
+        arc_x, arc_y = _rng.uniform((-50.0, -30.0), (50.0, 30.0)) * curvature_scale
+        mid_x = (start[0] + end[0]) / 2 + arc_x
+        mid_y = (start[1] + end[1]) / 2 + arc_y
+
+        if _bezier_path_core is not None:
+            # Numba-compiled loop (same math as the NumPy path below)
+            x, y, delay_ms = _bezier_path_core(
+                float(start[0]), float(start[1]), float(end[0]), float(end[1]),
+                float(mid_x), float(mid_y), steps, float(jitter), familiarity,
             )
-            y = (
-                (1 - t) ** 3 * start[1] +
-                3 * (1 - t) ** 2 * t * (start[1] + (mid_y - start[1]) * 0.3) +
-                3 * (1 - t) * t ** 2 * (end[1] + (mid_y - end[1]) * 0.3) +
-                t ** 3 * end[1]
-            )
-            
-            # CRITICAL: Add 1px Gaussian noise to every coordinate (hand tremors)
-            jitter_x = random.gauss(0, jitter)  # 1px standard deviation
-            jitter_y = random.gauss(0, jitter)  # 1px standard deviation
-            x += jitter_x
-            y += jitter_y
-            
-            # Fitts's Law: Velocity curve (Ease-In-Out)
-            # Slow at start and end, fast in middle
-            # Initialize ease_t to prevent UnboundLocalError
-            ease_t = 0.0
-            if t < 0.5:
-                # Ease-in (acceleration)
-                ease_t = 2 * t * t
-            else:
-                # Ease-out (deceleration)
-                ease_t = 1 - pow(-2 * t + 2, 2) / 2
-
-            # VANGUARD: Saccadic Tremors - High-frequency jitter tied to velocity
-            # Fix: compute ease_t BEFORE tremor math; velocity_factor peaks at mid-trajectory.
-            velocity_factor = 1.0 - (abs(ease_t - 0.5) * 2.0)
-            velocity_factor = max(0.0, min(1.0, velocity_factor))
-
-            # Ensure tremor amplitude/frequency utilize computed velocity_factor
-            tremor_amplitude = 0.3 + (velocity_factor * 0.4)  # 0.3-0.7px base
-            tremor_frequency = 1.0 + (velocity_factor * 2.0)  # 1.0-3.0x frequency
-
-            # Scale tremor with current jitter amplitude (fatigue increases jitter)
-            tremor_scale = max(0.8, min(2.2, jitter))
-            tremor_amplitude *= tremor_scale
-
-            for _ in range(int(tremor_frequency)):
-                x += random.gauss(0, tremor_amplitude)
-                y += random.gauss(0, tremor_amplitude)
-            
-            # Delay based on ease curve (faster in middle)
-            base_delay = 5  # ms per step
-            delay_ms = base_delay + (1 - ease_t) * 10  # 5-15ms range
-            if familiarity:
-                delay_ms *= 0.85  # 15% faster for familiar trajectories
-            
-            path.append((x, y, delay_ms))
-        
-        return path
+            return x, y, delay_ms
+
+        # Cubic Bezier curve (4 control points), both axes over all steps at once
+        # P(t) = (1-t)³P₀ + 3(1-t)²tP₁ + 3(1-t)t²P₂ + t³P₃
+        control = np.array([
+            [start[0], start[0] + (mid_x - start[0]) * 0.3, end[0] + (mid_x - end[0]) * 0.3, end[0]],
+            [start[1], start[1] + (mid_y - start[1]) * 0.3, end[1] + (mid_y - end[1]) * 0.3, end[1]],
+        ])
+        basis, tremor_sigma, delay_ms = _diffusion_t_tables(steps)
+
+        # CRITICAL: 1px Gaussian noise on every coordinate (hand tremors) plus the
+        # velocity-tied saccadic tremor, scaled with the current jitter amplitude
+        # (fatigue increases jitter). Independent Gaussians, so one draw with the
+        # combined sigma per point and axis.
+        tremor_scale = max(0.8, min(2.2, jitter))
+        sigma = np.sqrt(jitter * jitter + (tremor_sigma * tremor_scale) ** 2)
+        x, y = control @ basis + _rng.standard_normal((2, steps + 1)) * sigma
+
+        if familiarity:
+            delay_ms = delay_ms * 0.85  # 15% faster for familiar trajectories
+
+        return x, y, delay_ms
     
     @staticmethod
     async def move_to(
@@ -374,7 +464,7 @@ class DiffusionMouse:
         jitter_amp = 1.0 * get_fatigue_jitter_multiplier()
 
         # Generate Bezier path with fatigue-adjusted Gaussian noise
-        path = DiffusionMouse.generate_bezier_path(
+        xs, ys, delays = DiffusionMouse.generate_bezier_path(
             current_pos,
             target,
             steps,
@@ -384,19 +474,61 @@ class DiffusionMouse:
         
         # Execute movement
         global _tremor_move_log_t
-        if time.monotonic() - _tremor_move_log_t > 2.5:
-            _tremor_move_log_t = time.monotonic()
+        now = time.monotonic()
+        if now - _tremor_move_log_t > 2.5:
+            _tremor_move_log_t = now
             logger.info("Micro-tremor active")
-        for x, y, delay_ms in path:
-            tremor_x, tremor_y = inject_micro_tremor()
-            await page.mouse.move(x + tremor_x, y + tremor_y)
-            # Phase 6: thermal throttling micro-lags (3-12ms) when hot
-            extra = thermal_extra_delay_s()
-            await asyncio.sleep((delay_ms / 1000.0) + extra)  # Convert ms to seconds
+        # 8-12Hz micro-tremor for every step at once, evaluated at each step's
+        # scheduled time (start + the delays before it)
+        times = now + (np.cumsum(delays) - delays) / 1000.0
+        tremor_x, tremor_y = _micro_tremor_batch(times)
+        # Moves are pipelined: each one is sent without waiting for its protocol
+        # round-trip, which overlaps the biological sleep instead of adding to it.
+        # Tasks start in creation order, so the browser still sees moves in order.
+        moves = []
+        aborted = True
+        try:
+            for x, y, delay_ms in zip((xs + tremor_x).tolist(), (ys + tremor_y).tolist(), delays.tolist()):
+                if moves and moves[-1].done():
+                    moves[-1].result()  # surface a failed move (e.g. page closed) right away
+                moves.append(asyncio.ensure_future(page.mouse.move(x, y)))
+                # Phase 6: thermal throttling micro-lags (3-12ms) when hot
+                extra = thermal_extra_delay_s()
+                await asyncio.sleep((delay_ms / 1000.0) + extra)  # Convert ms to seconds
+            aborted = False
+        finally:
+            # Never leave moves running (or their errors unretrieved) after we
+            # return: on failure/cancellation drop the ones still in flight
+            if aborted:
+                for move in moves:
+                    move.cancel()
+            results = await asyncio.gather(*moves, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         
         return target
 
 
+_WEBGL_VENDORS = (
+    ("Intel Inc.", "Intel Iris OpenGL Engine"),
+    ("Google Inc. (Intel)", "ANGLE (Intel, Intel(R) Iris(TM) Plus Graphics 640 Direct3D11 vs_5_0 ps_5_0, D3D11)"),
+    ("Google Inc. (NVIDIA)", "ANGLE (NVIDIA, NVIDIA GeForce GTX 1060 Direct3D11 vs_5_0 ps_5_0, D3D11)"),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _seeded_gpu_draws(seed: int) -> Tuple[Tuple[str, str], float]:
+    # WebGL pick, then the audio-noise draw that follows it on the same stream
+    rng = random.Random(seed)
+    return rng.choice(_WEBGL_VENDORS), rng.uniform(0.00005, 0.0002)
+
+
+@functools.lru_cache(maxsize=1024)
+def _seeded_audio_noise(seed: int) -> float:
+    return random.Random(seed).uniform(0.00005, 0.0002)
+
+
 @dataclass
 class FingerprintConfig:
     """Fingerprint configuration for stealth"""
@@ -419,37 +551,37 @@ class FingerprintConfig:
     
     def __post_init__(self):
         """Randomize fingerprint on initialization"""
-        # Randomize WebGL vendor/renderer (seeded when provided)
-        gpu_rng = random.Random(self.gpu_seed) if self.gpu_seed is not None else random
-        vendors = [
-            ("Intel Inc.", "Intel Iris OpenGL Engine"),
-            ("Google Inc. (Intel)", "ANGLE (Intel, Intel(R) Iris(TM) Plus Graphics 640 Direct3D11 vs_5_0 ps_5_0, D3D11)"),
-            ("Google Inc. (NVIDIA)", "ANGLE (NVIDIA, NVIDIA GeForce GTX 1060 Direct3D11 vs_5_0 ps_5_0, D3D11)"),
-        ]
-        self.webgl["vendor"], self.webgl["renderer"] = gpu_rng.choice(vendors)
+        # Randomize WebGL vendor/renderer and audio noise (seeded when provided).
+        # Seeded draws are pure functions of the seed, so they come from a cache
+        # instead of building a fresh Mersenne Twister per config.
+        if self.gpu_seed is not None:
+            webgl, gpu_audio_noise = _seeded_gpu_draws(self.gpu_seed)
+        else:
+            webgl, gpu_audio_noise = random.choice(_WEBGL_VENDORS), None
+        self.webgl["vendor"], self.webgl["renderer"] = webgl
         
-        # Randomize audio noise (seeded when provided)
-        audio_rng = random.Random(self.audio_seed) if self.audio_seed is not None else gpu_rng
-        self.audio_noise = audio_rng.uniform(0.00005, 0.0002)
+        if self.audio_seed is not None:
+            self.audio_noise = _seeded_audio_noise(self.audio_seed)
+        elif gpu_audio_noise is not None:
+            self.audio_noise = gpu_audio_noise  # next draw on the GPU-seeded stream
+        else:
+            self.audio_noise = random.uniform(0.00005, 0.0002)
 
 
-def _js_seeded_rng(name: str, seed_expr: str) -> str:
-    """
-    Build a small seeded RNG for JS (xorshift32).
-    """
-    return f"""
-        function {name}__factory(seed) {{
+# Seeded xorshift32 RNG factory for the injected JS; emitted once per script,
+# each noise source is just a call with its seed
+_XORSHIFT32_FACTORY_JS = """
+        function __chimeraXorshift(seed) {
             let x = (seed | 0) || 1337;
-            return function() {{
+            return function() {
                 x ^= (x << 13);
                 x ^= (x >>> 17);
                 x ^= (x << 5);
                 // Convert to [0,1)
                 return ((x >>> 0) / 4294967296);
-            }};
-        }}
-        const {name} = {name}__factory({seed_expr});
-    """
+            };
+        }
+"""
 
 
 @dataclass
@@ -528,8 +660,90 @@ def generate_stealth_script(
     """
     Generate JavaScript stealth patches for fingerprint masking.
     chrome_version must match CHROME_UA_VERSION and the browser's Sec-Ch-Ua for JA3 consistency.
+    Fills the pre-built template for (platform, chrome_version, is_mobile) with
+    the per-profile/per-mission values.
+    """
+    seeds = hardware_seeds or {}
+    # Order matches _STEALTH_TEMPLATE_VARS
+    values = (
+        profile.vendor,
+        profile.hardware_concurrency,
+        profile.device_memory,
+        profile.max_touch_points,
+        json.dumps(fingerprint.languages),
+        fingerprint.language,
+        fingerprint.webgl["vendor"],
+        fingerprint.webgl["renderer"],
+        fingerprint.color_depth,
+        fingerprint.audio_noise,
+        int(seeds.get("gpu_seed", fingerprint.gpu_seed or 1337)),
+        int(seeds.get("audio_seed", fingerprint.audio_seed or 7331)),
+        int(seeds.get("canvas_seed", fingerprint.canvas_seed or 9001)),
+    )
+    return _filled_stealth_script(profile.platform, chrome_version, profile.is_mobile, values)
+
+
+@functools.lru_cache(maxsize=64)
+def _filled_stealth_script(platform: str, chrome_version: str, is_mobile: bool, values: tuple) -> str:
+    """
+    Substituted stealth script for one full set of inputs. Re-applying the
+    same profile/fingerprint/seeds (context rebuilds within a mission) reuses
+    the string instead of filling the template again.
+    """
+    template = _stealth_script_template(platform, chrome_version, is_mobile)
+    return template.substitute(dict(zip(_STEALTH_TEMPLATE_VARS, values)))
+
+
+# Values substituted per call; everything else is baked into the per-platform template
+_STEALTH_TEMPLATE_VARS = (
+    "vendor", "hardware_concurrency", "device_memory", "max_touch_points",
+    "languages_json", "language", "webgl_vendor", "webgl_renderer",
+    "color_depth", "audio_noise", "gpu_seed", "audio_seed", "canvas_seed",
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _stealth_script_template(platform: str, chrome_version: str, is_mobile: bool) -> string.Template:
     """
-    _platform_ver = "10.0.0" if (getattr(profile, "platform", "") or "").startswith("Win") else "10.15.7"
+    Partially evaluate the stealth script for one (platform, chrome_version,
+    is_mobile) combination; a fleet only has a handful, so this runs a few
+    times per process.
+    """
+    marks = {name: f"\x00{name}\x00" for name in _STEALTH_TEMPLATE_VARS}
+    text = _render_stealth_script(
+        platform=platform,
+        is_mobile=is_mobile,
+        chrome_version=chrome_version,
+        chrome_major=chrome_version.split(".", 1)[0],
+        **marks,
+    )
+    text = text.replace("$", "$$")
+    for name, mark in marks.items():
+        text = text.replace(mark, "${" + name + "}")
+    return string.Template(text)
+
+
+def _render_stealth_script(
+    platform: str,
+    vendor: str,
+    hardware_concurrency: int,
+    device_memory: int,
+    max_touch_points: int,
+    is_mobile: bool,
+    languages_json: str,
+    language: str,
+    webgl_vendor: str,
+    webgl_renderer: str,
+    color_depth: int,
+    audio_noise: float,
+    chrome_version: str,
+    chrome_major: str,
+    gpu_seed: int,
+    audio_seed: int,
+    canvas_seed: int,
+) -> str:
+    _platform_ver = "10.0.0" if (platform or "").startswith("Win") else "10.15.7"
+    is_mobile_js = "true" if is_mobile else "false"
     return f"""
         // ============================================
         // 2026 STEALTH PATCHES - Full Fingerprint Spoofing
@@ -537,12 +751,13 @@ def generate_stealth_script(
 
         // Phase 6: Hardware realism seeds (stable per mission)
         const __chimeraSeeds = {{
-            gpu: {int((hardware_seeds or {}).get("gpu_seed", fingerprint.gpu_seed or 1337))},
-            audio: {int((hardware_seeds or {}).get("audio_seed", fingerprint.audio_seed or 7331))},
-            canvas: {int((hardware_seeds or {}).get("canvas_seed", fingerprint.canvas_seed or 9001))}
+            gpu: {gpu_seed},
+            audio: {audio_seed},
+            canvas: {canvas_seed}
         }};
-        { _js_seeded_rng("__chimeraRandCanvas", "__chimeraSeeds.canvas") }
-        { _js_seeded_rng("__chimeraRandAudio", "__chimeraSeeds.audio") }
+        {_XORSHIFT32_FACTORY_JS}
+        const __chimeraRandCanvas = __chimeraXorshift(__chimeraSeeds.canvas);
+        const __chimeraRandAudio = __chimeraXorshift(__chimeraSeeds.audio);
         
         // 1. Navigator patches (CRITICAL: Remove webdriver with IMMUTABLE lock)
         Object.defineProperty(navigator, 'webdriver', {{ 
@@ -553,39 +768,39 @@ def generate_stealth_script(
         
         // IMMUTABLE LOCKDOWN: Prevent CreepJS from probing past our spoofing
         Object.defineProperty(navigator, 'platform', {{ 
-            get: () => '{profile.platform}',
+            get: () => '{platform}',
             configurable: false,
             writable: false
         }});
         Object.defineProperty(navigator, 'vendor', {{ 
-            get: () => '{profile.vendor}',
+            get: () => '{vendor}',
             configurable: false,
             writable: false
         }});
         Object.defineProperty(navigator, 'hardwareConcurrency', {{ 
-            get: () => {profile.hardware_concurrency},
+            get: () => {hardware_concurrency},
             configurable: false,
             writable: false
         }});
         Object.defineProperty(navigator, 'deviceMemory', {{ 
-            get: () => {profile.device_memory},
+            get: () => {device_memory},
             configurable: false,
             writable: false
         }});
         Object.defineProperty(navigator, 'maxTouchPoints', {{ 
-            get: () => {profile.max_touch_points},
+            get: () => {max_touch_points},
             configurable: false,
             writable: false
         }});
         
         // IMMUTABLE: Lock languages array
         Object.defineProperty(navigator, 'languages', {{ 
-            get: () => {json.dumps(fingerprint.languages)},
+            get: () => {languages_json},
             configurable: false,
             writable: false
         }});
         Object.defineProperty(navigator, 'language', {{ 
-            get: () => '{fingerprint.language}',
+            get: () => '{language}',
             configurable: false,
             writable: false
         }});
@@ -610,20 +825,16 @@ def generate_stealth_script(
             originalQuery(parameters)
         );
         
-        // 4. WebGL fingerprint spoofing
-        const getParameterOrig = WebGLRenderingContext.prototype.getParameter;
-        WebGLRenderingContext.prototype.getParameter = function(parameter) {{
-            if (parameter === 37445) return '{fingerprint.webgl["vendor"]}';
-            if (parameter === 37446) return '{fingerprint.webgl["renderer"]}';
-            return getParameterOrig.call(this, parameter);
-        }};
-        
-        const getParameter2Orig = WebGL2RenderingContext.prototype.getParameter;
-        WebGL2RenderingContext.prototype.getParameter = function(parameter) {{
-            if (parameter === 37445) return '{fingerprint.webgl["vendor"]}';
-            if (parameter === 37446) return '{fingerprint.webgl["renderer"]}';
-            return getParameter2Orig.call(this, parameter);
-        }};
+        // 4. WebGL fingerprint spoofing (UNMASKED_VENDOR/RENDERER_WEBGL), one
+        // dispatch table shared by the WebGL1 and WebGL2 prototypes
+        const __chimeraWebGLOverrides = {{ 37445: '{webgl_vendor}', 37446: '{webgl_renderer}' }};
+        function __chimeraPatchGL(proto) {{
+            const orig = proto.getParameter;
+            proto.getParameter = function(parameter) {{
+                return __chimeraWebGLOverrides[parameter] ?? orig.call(this, parameter);
+            }};
+        }}
+        [window.WebGLRenderingContext, window.WebGL2RenderingContext].forEach((C) => C && __chimeraPatchGL(C.prototype));
         
         // 5. Canvas fingerprint noise
         const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
@@ -632,9 +843,12 @@ def generate_stealth_script(
                 const context = this.getContext('2d');
                 if (context) {{
                     const imageData = context.getImageData(0, 0, this.width, this.height);
-                    for (let i = 0; i < imageData.data.length; i += 4) {{
-                        // Seeded noise: stable per mission, tiny amplitude.
-                        imageData.data[i] += Math.floor(__chimeraRandCanvas() * 2);
+                    const data = imageData.data;
+                    // Seeded noise: stable per mission, tiny amplitude, on the red
+                    // channel of every 64th pixel (enough to change the hash without
+                    // an O(W×H) loop on the main thread). Clamped array, so no wrap.
+                    for (let i = 0; i < data.length; i += 4 * 64) {{
+                        data[i] += (__chimeraRandCanvas() * 2) | 0;
                     }}
                     context.putImageData(imageData, 0, 0);
                 }}
@@ -652,7 +866,7 @@ def generate_stealth_script(
                 analyser.getFloatFrequencyData = function(array) {{
                     originalGetFloatFrequencyData(array);
                     for (let i = 0; i < array.length; i++) {{
-                        array[i] += (__chimeraRandAudio() - 0.5) * {fingerprint.audio_noise};
+                        array[i] += (__chimeraRandAudio() - 0.5) * {audio_noise};
                     }}
                 }};
                 return analyser;
@@ -682,8 +896,8 @@ def generate_stealth_script(
         }}
         
         // 9. Screen properties
-        Object.defineProperty(screen, 'colorDepth', {{ get: () => {fingerprint.color_depth} }});
-        Object.defineProperty(screen, 'pixelDepth', {{ get: () => {fingerprint.color_depth} }});
+        Object.defineProperty(screen, 'colorDepth', {{ get: () => {color_depth} }});
+        Object.defineProperty(screen, 'pixelDepth', {{ get: () => {color_depth} }});
         
         // 10. Plugins (realistic set) - Moved to immutable section below
         
@@ -706,44 +920,23 @@ def generate_stealth_script(
             enumerable: true
         }});
         
-        Object.defineProperty(navigator, 'languages', {{
-            get: () => {json.dumps(fingerprint.languages)},
-            writable: false,
-            configurable: false,
-            enumerable: true
-        }});
-        
-        Object.defineProperty(navigator, 'hardwareConcurrency', {{
-            get: () => {profile.hardware_concurrency},
-            writable: false,
-            configurable: false,
-            enumerable: true
-        }});
-        
-        Object.defineProperty(navigator, 'deviceMemory', {{
-            get: () => {profile.device_memory},
-            writable: false,
-            configurable: false,
-            enumerable: true
-        }});
-        
         // 12. Client Hints API (modern Chrome)
         if (navigator.userAgentData) {{
             Object.defineProperty(navigator, 'userAgentData', {{
                 get: () => ({{
                     brands: [
-                        {{ brand: 'Google Chrome', version: '{chrome_version.split(".")[0]}' }},
-                        {{ brand: 'Chromium', version: '{chrome_version.split(".")[0]}' }},
+                        {{ brand: 'Google Chrome', version: '{chrome_major}' }},
+                        {{ brand: 'Chromium', version: '{chrome_major}' }},
                         {{ brand: 'Not_A Brand', version: '8' }}
                     ],
-                    mobile: {str(profile.is_mobile).lower()},
-                    platform: '{profile.platform}',
+                    mobile: {is_mobile_js},
+                    platform: '{platform}',
                     getHighEntropyValues: () => Promise.resolve({{
                         architecture: 'x86',
                         bitness: '64',
                         brands: [
-                            {{ brand: 'Google Chrome', version: '{chrome_version.split(".")[0]}' }},
-                            {{ brand: 'Chromium', version: '{chrome_version.split(".")[0]}' }},
+                            {{ brand: 'Google Chrome', version: '{chrome_major}' }},
+                            {{ brand: 'Chromium', version: '{chrome_major}' }},
                             {{ brand: 'Not_A Brand', version: '8' }}
                         ],
                         fullVersionList: [
@@ -751,9 +944,9 @@ def generate_stealth_script(
                             {{ brand: 'Chromium', version: '{chrome_version}' }},
                             {{ brand: 'Not_A Brand', version: '8.0.0.0' }}
                         ],
-                        mobile: {str(profile.is_mobile).lower()},
+                        mobile: {is_mobile_js},
                         model: '',
-                        platform: '{profile.platform}',
+                        platform: '{platform}',
                         platformVersion: '{_platform_ver}',
                         uaFullVersion: '{chrome_version}'
                     }})
@@ -778,12 +971,47 @@ def generate_stealth_script(
         """
 
 
+def _snapshot_env() -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        chrome_ua_version=os.getenv("CHROME_UA_VERSION", "142.0.0.0").strip(),
+        fallback_worker_id=os.getenv("WORKER_ID") or os.getenv("RAILWAY_SERVICE_NAME") or "worker-0",
+    )
+
+
+# Deploy-level env captured once at import. CHIMERA_WORKER_ID / CHIMERA_MISSION_ID
+# stay live reads: workers.rotate_hardware_identity sets them per mission.
+_ENV = _snapshot_env()
+
+
+def reload_env() -> None:
+    """Re-read the deploy-level stealth env vars (tests, or after mutating os.environ)."""
+    global _ENV
+    _ENV = _snapshot_env()
+
+
+# Contexts already carrying the stealth init script -> (hardware_id, platform, fingerprint).
+# Weak keys: entries go away with the context, and a recycled id() can never alias one.
+_stealthed_contexts: "weakref.WeakKeyDictionary[Any, Tuple[str, str, FingerprintConfig]]" = weakref.WeakKeyDictionary()
+
+
 async def apply_stealth_patches(page, profile: Optional[DeviceProfile] = None, fingerprint: Optional[FingerprintConfig] = None):
     """
     Apply stealth patches to a Playwright page.
     
     This must be called BEFORE any page interaction.
+    The stealth script is registered once on the page's BrowserContext, so
+    every page in it (e.g. prefetch tabs) inherits it; later calls for the
+    same context only add the per-page kernel rendering script and return
+    the fingerprint the context was patched with.
     """
+    context = page.context
+    applied = _stealthed_contexts.get(context)
+    if applied is not None:
+        hardware_id, platform, context_fingerprint = applied
+        await force_kernel_rendering(page, hardware_id=hardware_id, platform=platform)
+        logger.debug("🕵️ Stealth already on context; kernel rendering applied to page")
+        return context_fingerprint
+
     if profile is None:
         profile = DeviceProfile()
     if fingerprint is None:
@@ -795,13 +1023,7 @@ async def apply_stealth_patches(page, profile: Optional[DeviceProfile] = None, f
         from db_bridge import allocate_hardware_entropy
         worker_id = getattr(profile, "worker_id", None)
         # Prefer env-supplied worker id when available
-        worker_id = (
-            worker_id
-            or os.getenv("CHIMERA_WORKER_ID")
-            or os.getenv("WORKER_ID")
-            or os.getenv("RAILWAY_SERVICE_NAME")
-            or "worker-0"
-        )
+        worker_id = worker_id or os.getenv("CHIMERA_WORKER_ID") or _ENV.fallback_worker_id
         mission_id = os.getenv("CHIMERA_MISSION_ID") or f"mission-{int(time.time())}"
         hardware_seeds = allocate_hardware_entropy(worker_id=str(worker_id), mission_id=str(mission_id))
     except Exception as e:
@@ -821,24 +1043,28 @@ async def apply_stealth_patches(page, profile: Optional[DeviceProfile] = None, f
         )
 
     # Align with workers: CHROME_UA_VERSION for JA3/header consistency (Chrome 142/Windows 11).
-    chrome_version = os.getenv("CHROME_UA_VERSION", "142.0.0.0").strip()
+    chrome_version = _ENV.chrome_ua_version
     stealth_script = generate_stealth_script(profile, fingerprint, chrome_version, hardware_seeds=hardware_seeds or None)
     
-    await page.add_init_script(stealth_script)
+    await context.add_init_script(stealth_script)
     try:
-        seed_blob = json.dumps(
-            {
-                "platform": profile.platform,
-                "vendor": profile.vendor,
-                "hc": profile.hardware_concurrency,
-                "seeds": hardware_seeds or {},
-            },
-            sort_keys=True,
-        )
-        hardware_id = hashlib.sha256(seed_blob.encode("utf-8")).hexdigest()[:12]
+        # 48-bit label: blake2b sized to 6 bytes, fed field by field (no JSON blob)
+        h = hashlib.blake2b(digest_size=6)
+        h.update(f"{profile.platform}\x1f{profile.vendor}\x1f{profile.hardware_concurrency}".encode("utf-8"))
+        for name, value in sorted((hardware_seeds or {}).items()):
+            h.update(f"\x1f{name}={value}".encode("utf-8"))
+        hardware_id = h.hexdigest()
     except Exception:
         hardware_id = "chimera-core"
+    _stealthed_contexts[context] = (hardware_id, profile.platform, fingerprint)
     await force_kernel_rendering(page, hardware_id=hardware_id, platform=profile.platform)
-    logger.debug("🕵️ Stealth patches applied to page")
+    logger.debug("🕵️ Stealth patches applied to context")
 
     return fingerprint
+
+
+# JIT warmup: compile (or load from numba's on-disk cache) the path kernel at
+# import so the first real mouse move doesn't pay the compile cost.
+# CHIMERA_WARMUP_JIT=0 skips it (e.g. short-lived tooling imports).
+if _bezier_path_core is not None and os.getenv("CHIMERA_WARMUP_JIT", "1") == "1":
+    _bezier_path_core(0.0, 0.0, 10.0, 10.0, 5.0, 5.0, 5, 1.0, False)
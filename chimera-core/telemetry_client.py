@@ -11,16 +11,104 @@ Pushes real-time diagnostic data to BrainScraper V2 Pilot interface:
 """
 
 import os
-import base64
+import asyncio
+import atexit
+import binascii
+import json
 import time
+import weakref
+from collections import deque
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
-from typing import Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
 from PIL import Image
 import logging
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Cap on fire-and-forget pushes awaiting BrainScraper; extras are dropped
+_MAX_IN_FLIGHT = 32
+
+# Mouse points kept per mission for the heatmap (only the latest are ever sent)
+_MOUSE_BUFFER_LEN = 10
+
+# Statuses after which a mission's mouse buffer is released
+_TERMINAL_STATUSES = frozenset({'completed', 'failed'})
+
+# BRAINSCRAPER_BATCH coalescing: window after the first queued push, max pushes
+# per POST, and queue bound (beyond it pushes are dropped like in-flight overflow)
+_BATCH_WINDOW_S = 0.1
+_BATCH_MAX = 32
+_BATCH_QUEUE_MAX = 256
+
+# Raw bytes per base64 chunk; a multiple of 3 so chunks concatenate without padding
+_B64_CHUNK = 57 * 1024
+
+
+def _dumps_payload(payload: Dict) -> bytes:
+    """Serialize telemetry fields to JSON bytes (orjson when installed; handles NumPy scalars from the VLM path)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; json handles them
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+def _iter_json_body(payload: Dict, screenshot: Optional[bytes] = None) -> Iterator[bytes]:
+    """
+    Yield the JSON request body, streaming the screenshot data URI in base64 chunks.
+
+    The screenshot is never materialized as one base64 str: the metadata is
+    serialized once and the "screenshot_url" field is spliced in chunk by chunk.
+
+    Args:
+        payload: Telemetry fields (everything except the screenshot)
+        screenshot: Raw screenshot bytes (JPEG or PNG)
+
+    Yields:
+        UTF-8 encoded pieces of a single JSON object
+    """
+    head = _dumps_payload(payload)
+    if not screenshot:
+        yield head
+        return
+    mime = b"image/jpeg" if screenshot[:2] == b"\xff\xd8" else b"image/png"
+    yield head[:-1] + b',"screenshot_url":"data:' + mime + b';base64,'
+    view = memoryview(screenshot)
+    for i in range(0, len(view), _B64_CHUNK):
+        yield binascii.b2a_base64(view[i:i + _B64_CHUNK], newline=False)
+    yield b'"}'
+
+
+def _iter_batch_body(items: List[Tuple[Dict, Optional[bytes], Optional[bytes]]]) -> Iterator[bytes]:
+    """Yield {"batch": [...]} with each item streamed like _iter_json_body."""
+    yield b'{"batch":['
+    for i, (payload, frame, _) in enumerate(items):
+        if i:
+            yield b','
+        yield from _iter_json_body(payload, frame)
+    yield b']}'
+
+
+async def _aiter_body(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
 
 class TelemetryClient:
     """Client for pushing telemetry to V2 Pilot diagnostic interface"""
@@ -37,6 +125,29 @@ class TelemetryClient:
             'http://brainscraper.railway.internal:3000'
         )
         self.telemetry_endpoint = f"{self.brainscraper_url}/api/v2-pilot/telemetry"
+        # BRAINSCRAPER_BINARY=1: send frames as multipart file parts instead of base64 data URIs
+        self.binary_transport = os.getenv('BRAINSCRAPER_BINARY') == '1'
+        # BRAINSCRAPER_BATCH=1: push_nowait coalesces pushes into one {"batch": [...]} POST
+        self.batch_transport = os.getenv('BRAINSCRAPER_BATCH') == '1'
+
+        # Keep-alive session so pushes reuse one TCP/TLS connection to BrainScraper
+        self._session = requests.Session()
+        self._session.headers.update({'Connection': 'keep-alive'})
+        self._session.mount(
+            self.brainscraper_url,
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=8,
+                max_retries=Retry(total=1, backoff_factor=0.1),
+            ),
+        )
+        # Async side (push_async/push_nowait): httpx client is created lazily on first use
+        self._async_client = None
+        self._in_flight: set = set()
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        # Bounded per-mission mouse trail fed by append_mouse()
+        self._mouse_buffers: Dict[str, Deque[Dict[str, Any]]] = {}
         logger.info(f"📡 Telemetry client initialized: {self.telemetry_endpoint}")
     
     def push(
@@ -62,10 +173,10 @@ class TelemetryClient:
             mission_id: Unique mission identifier
             coordinate_drift: {suggested: {x, y}, actual: {x, y}, confidence}
             fingerprint: {ja3_hash, user_agent, sec_ch_ua, isp_carrier, session_id, ip_changed}
-            screenshot: Raw screenshot bytes (PNG)
+            screenshot: Raw screenshot bytes (JPEG or PNG)
             region_coords: (x, y) coordinates for 200x200 crop center
             grounding_bbox: {x, y, width, height} bounding box for VLM focus area
-            mouse_movements: List of {x, y, timestamp}
+            mouse_movements: List of {x, y, timestamp} (defaults to the append_mouse() buffer)
             decision_trace: List of {step, action, timestamp, confidence}
             vision_confidence: VLM confidence score (0.0-1.0)
             fallback_triggered: Whether olmOCR-2 fallback was triggered
@@ -77,79 +188,319 @@ class TelemetryClient:
             True if push succeeded, False otherwise
         """
         try:
-            payload = {'mission_id': mission_id}
-            
-            # Add coordinate drift
-            if coordinate_drift:
-                payload['coordinate_drift'] = coordinate_drift
-            
-            # Add fingerprint
-            if fingerprint:
-                payload['fingerprint'] = fingerprint
-            
-            # Add screenshot (convert to data URI)
-            if screenshot:
-                screenshot_b64 = base64.b64encode(screenshot).decode('utf-8')
-                payload['screenshot_url'] = f"data:image/png;base64,{screenshot_b64}"
-                
-                # Extract region proposal if coordinates provided
-                if region_coords:
-                    region_b64 = self._extract_region_proposal(screenshot, region_coords)
-                    if region_b64:
-                        payload['region_proposal'] = region_b64
-            
-            # Add grounding bounding box
-            if grounding_bbox:
-                payload['grounding_bbox'] = grounding_bbox
-            
-            # Add mouse movements (keep last 10)
-            if mouse_movements:
-                payload['mouse_movements'] = mouse_movements[-10:]
-            
-            # Add decision trace
-            if decision_trace:
-                payload['decision_trace'] = decision_trace
-            
-            # Add VLM metrics
-            if vision_confidence is not None:
-                payload['vision_confidence'] = vision_confidence
-            if fallback_triggered is not None:
-                payload['fallback_triggered'] = fallback_triggered
-            
-            # Add status
-            if status:
-                payload['status'] = status
-            
-            # Add trauma signals
-            if trauma_signals:
-                payload['trauma_signals'] = trauma_signals
-                if trauma_details:
-                    payload['trauma_details'] = trauma_details
-            
-            # Send to BrainScraper
-            response = requests.post(
+            payload, frame, region_png = self._build_payload(
+                mission_id=mission_id,
+                coordinate_drift=coordinate_drift,
+                fingerprint=fingerprint,
+                screenshot=screenshot,
+                region_coords=region_coords,
+                grounding_bbox=grounding_bbox,
+                mouse_movements=mouse_movements,
+                decision_trace=decision_trace,
+                vision_confidence=vision_confidence,
+                fallback_triggered=fallback_triggered,
+                status=status,
+                trauma_signals=trauma_signals,
+                trauma_details=trauma_details,
+            )
+            response = self._session.post(
                 self.telemetry_endpoint,
-                json=payload,
-                timeout=5
+                timeout=5,
+                **self._body_kwargs([(payload, frame, region_png)])
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(
-                    f"✅ Telemetry pushed: {mission_id} "
-                    f"({result.get('fields_updated', 0)} fields)"
+            return self._handle_response(mission_id, response)
+        except Exception as e:
+            logger.error(f"❌ Exception pushing telemetry: {e}")
+            return False
+
+    async def push_async(self, **fields) -> bool:
+        """
+        Async variant of push() for callers on the worker event loop.
+
+        Payload building (region crop) runs on a thread and the POST
+        goes through a pooled httpx.AsyncClient, so the loop never blocks on
+        BrainScraper.
+
+        Args:
+            **fields: Same keyword arguments as push()
+
+        Returns:
+            True if push succeeded, False otherwise
+        """
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self.push, **fields)
+        mission_id = fields.get('mission_id')
+        try:
+            payload, frame, region_png = await asyncio.to_thread(self._build_payload, **fields)
+            client = self._ensure_async_client()
+            response = await client.post(
+                self.telemetry_endpoint,
+                **self._body_kwargs([(payload, frame, region_png)], async_body=True)
+            )
+            return self._handle_response(mission_id, response)
+        except Exception as e:
+            logger.error(f"❌ Exception pushing telemetry: {e}")
+            return False
+
+    def append_mouse(self, mission_id: str, point: Dict[str, Any]) -> None:
+        """
+        Record a mouse point for the mission's heatmap.
+
+        Only the last 10 points are kept, so callers don't need their own
+        growing list; push() sends the buffer when mouse_movements is omitted.
+
+        Args:
+            mission_id: Mission ID
+            point: {x, y, timestamp}
+        """
+        buf = self._mouse_buffers.get(mission_id)
+        if buf is None:
+            buf = self._mouse_buffers[mission_id] = deque(maxlen=_MOUSE_BUFFER_LEN)
+        buf.append(point)
+
+    def push_nowait(self, **fields) -> Optional[asyncio.Task]:
+        """
+        Schedule push_async() on the running loop without waiting for it.
+
+        Telemetry is best-effort: when too many pushes are already in flight
+        the new one is dropped rather than queued behind a slow BrainScraper.
+        With BRAINSCRAPER_BATCH=1 the push is queued for the coalescing flusher.
+
+        Args:
+            **fields: Same keyword arguments as push()
+
+        Returns:
+            The scheduled task, or None if the push was dropped or batched
+        """
+        if self.batch_transport:
+            self._enqueue(fields)
+            return None
+        if len(self._in_flight) >= _MAX_IN_FLIGHT:
+            logger.debug("📡 Telemetry push dropped: %d already in flight", len(self._in_flight))
+            return None
+        task = asyncio.create_task(self.push_async(**fields))
+        self._in_flight.add(task)
+        task.add_done_callback(self._on_push_done)
+        return task
+
+    def _enqueue(self, fields: Dict) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=_BATCH_QUEUE_MAX)
+            self._flusher = asyncio.create_task(self._flush_loop())
+        try:
+            self._queue.put_nowait(fields)
+        except asyncio.QueueFull:
+            logger.debug("📡 Telemetry push dropped: batch queue full")
+
+    async def _flush_loop(self) -> None:
+        """Coalesce queued pushes: wait up to 100ms after the first, then POST them together."""
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = loop.time() + _BATCH_WINDOW_S
+            closing = False
+            while len(batch) < _BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    fields = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if fields is None:
+                    closing = True
+                    break
+                batch.append(fields)
+            await self._post_batch(batch)
+            if closing:
+                return
+
+    async def _post_batch(self, batch: List[Dict]) -> bool:
+        """POST several pushes as one {"batch": [...]} request."""
+        label = f"batch of {len(batch)}"
+        try:
+            items = await asyncio.to_thread(lambda: [self._build_payload(**fields) for fields in batch])
+            if HTTPX_AVAILABLE:
+                response = await self._ensure_async_client().post(
+                    self.telemetry_endpoint,
+                    **self._body_kwargs(items, async_body=True, batch=True)
                 )
-                return True
             else:
-                logger.error(
-                    f"❌ Telemetry push failed: {response.status_code} - {response.text}"
+                response = await asyncio.to_thread(
+                    self._session.post,
+                    self.telemetry_endpoint,
+                    timeout=5,
+                    **self._body_kwargs(items, batch=True)
                 )
-                return False
-                
+            return self._handle_response(label, response)
         except Exception as e:
-            logger.error(f"❌ Exception pushing telemetry: {e}")
+            logger.error(f"❌ Exception pushing telemetry {label}: {e}")
             return False
-    
+
+    def _on_push_done(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("Telemetry push task failed: %s", task.exception())
+
+    def _ensure_async_client(self):
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=5,
+                limits=httpx.Limits(
+                    max_connections=8,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=60,
+                ),
+            )
+        return self._async_client
+
+    def _body_kwargs(
+        self,
+        items: List[Tuple[Dict, Optional[bytes], Optional[bytes]]],
+        async_body: bool = False,
+        batch: bool = False
+    ) -> Dict:
+        """
+        Request body arguments for the configured transport.
+
+        Args:
+            items: (payload, frame, region_png) tuples from _build_payload
+            async_body: Build an httpx (async) body instead of a requests one
+            batch: Send all items as {"batch": [...]}; otherwise items holds one push
+
+        Returns:
+            Keyword arguments for session.post / client.post
+        """
+        if not self.binary_transport:
+            # Generator body: sent chunked, screenshot base64 streamed piecewise
+            headers = {'Content-Type': 'application/json'}
+            body = _iter_batch_body(items) if batch else _iter_json_body(items[0][0], items[0][1])
+            if async_body:
+                return {'content': _aiter_body(body), 'headers': headers}
+            return {'data': body, 'headers': headers}
+
+        # payload_json rides as a plain part so every binary push is multipart/form-data;
+        # batched frames are suffixed with their index in the batch
+        meta = {'batch': [payload for payload, _, _ in items]} if batch else items[0][0]
+        files = {'payload_json': (None, _dumps_payload(meta), 'application/json')}
+        for i, (_, frame, region_png) in enumerate(items):
+            suffix = f'_{i}' if batch else ''
+            if frame:
+                if frame[:2] == b"\xff\xd8":
+                    files[f'screenshot{suffix}'] = ('frame.jpg', frame, 'image/jpeg')
+                else:
+                    files[f'screenshot{suffix}'] = ('frame.png', frame, 'image/png')
+            if region_png:
+                files[f'region_proposal{suffix}'] = ('region.png', region_png, 'image/png')
+        return {'files': files}
+
+    def _build_payload(
+        self,
+        mission_id: str,
+        coordinate_drift: Optional[Dict] = None,
+        fingerprint: Optional[Dict] = None,
+        screenshot: Optional[bytes] = None,
+        region_coords: Optional[Tuple[int, int]] = None,
+        grounding_bbox: Optional[Dict] = None,
+        mouse_movements: Optional[List[Dict]] = None,
+        decision_trace: Optional[List[Dict]] = None,
+        vision_confidence: Optional[float] = None,
+        fallback_triggered: Optional[bool] = None,
+        status: Optional[str] = None,
+        trauma_signals: Optional[List[str]] = None,
+        trauma_details: Optional[str] = None
+    ) -> Tuple[Dict, Optional[bytes], Optional[bytes]]:
+        payload = {'mission_id': mission_id}
+        
+        # Add coordinate drift
+        if coordinate_drift:
+            payload['coordinate_drift'] = coordinate_drift
+        
+        # Add fingerprint
+        if fingerprint:
+            payload['fingerprint'] = fingerprint
+        
+        # Extract region proposal if coordinates provided (the screenshot
+        # itself is streamed into the body by _iter_json_body)
+        region_png = None
+        if screenshot and region_coords:
+            if self.binary_transport:
+                region_png = self._crop_region(screenshot, region_coords)
+            else:
+                region_b64 = self._extract_region_proposal(screenshot, region_coords)
+                if region_b64:
+                    payload['region_proposal'] = region_b64
+        
+        # Add grounding bounding box
+        if grounding_bbox:
+            payload['grounding_bbox'] = grounding_bbox
+        
+        # Add mouse movements (keep last 10), falling back to the append_mouse() buffer
+        if mouse_movements:
+            payload['mouse_movements'] = mouse_movements[-_MOUSE_BUFFER_LEN:]
+        elif mouse_movements is None:
+            buf = self._mouse_buffers.get(mission_id)
+            if buf:
+                payload['mouse_movements'] = list(buf)
+        if status in _TERMINAL_STATUSES:
+            self._mouse_buffers.pop(mission_id, None)
+        
+        # Add decision trace
+        if decision_trace:
+            payload['decision_trace'] = decision_trace
+        
+        # Add VLM metrics
+        if vision_confidence is not None:
+            payload['vision_confidence'] = vision_confidence
+        if fallback_triggered is not None:
+            payload['fallback_triggered'] = fallback_triggered
+        
+        # Add status
+        if status:
+            payload['status'] = status
+        
+        # Add trauma signals
+        if trauma_signals:
+            payload['trauma_signals'] = trauma_signals
+            if trauma_details:
+                payload['trauma_details'] = trauma_details
+
+        return payload, screenshot, region_png
+
+    def _handle_response(self, mission_id: str, response) -> bool:
+        if response.status_code == 200:
+            result = response.json()
+            logger.info(
+                f"✅ Telemetry pushed: {mission_id} "
+                f"({result.get('fields_updated', 0)} fields)"
+            )
+            return True
+        logger.error(
+            f"❌ Telemetry push failed: {response.status_code} - {response.text}"
+        )
+        return False
+
+    def close(self) -> None:
+        """Release pooled connections to BrainScraper."""
+        self._session.close()
+
+    async def aclose(self) -> None:
+        """Flush batched pushes and wait for in-flight ones, then release both connection pools."""
+        if self._flusher is not None:
+            await self._queue.put(None)
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._queue = None
+            self._flusher = None
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
     def _extract_region_proposal(
         self,
         screenshot: bytes,
@@ -167,6 +518,18 @@ class TelemetryClient:
         Returns:
             Base64 encoded crop, or None if failed
         """
+        crop_png = self._crop_region(screenshot, center, size)
+        if crop_png is None:
+            return None
+        return binascii.b2a_base64(crop_png, newline=False).decode('ascii')
+
+    def _crop_region(
+        self,
+        screenshot: bytes,
+        center: Tuple[int, int],
+        size: int = 200
+    ) -> Optional[bytes]:
+        """Crop the region proposal and return it as raw PNG bytes (None on failure)."""
         try:
             img = Image.open(BytesIO(screenshot))
             x, y = center
@@ -178,14 +541,16 @@ class TelemetryClient:
             right = min(img.width, x + half_size)
             bottom = min(img.height, y + half_size)
             
-            # Crop and resize to ensure 200x200
+            # Crop, resizing only edge crops back to 200x200 (BILINEAR is
+            # plenty for a telemetry thumbnail and far cheaper than LANCZOS)
             crop = img.crop((left, top, right, bottom))
-            crop = crop.resize((size, size), Image.LANCZOS)
+            if crop.size != (size, size):
+                crop = crop.resize((size, size), Image.BILINEAR)
             
-            # Convert to base64
+            # Fast zlib level: telemetry, not storage
             buffer = BytesIO()
-            crop.save(buffer, format='PNG')
-            return base64.b64encode(buffer.getvalue()).decode('utf-8')
+            crop.save(buffer, format='PNG', optimize=False, compress_level=1)
+            return buffer.getvalue()
             
         except Exception as e:
             logger.error(f"Failed to extract region proposal: {e}")
@@ -324,12 +689,37 @@ class TelemetryClient:
         )
 
 
-# Singleton instance
-_telemetry_client = None
+# One client per event loop: the httpx client and batch flusher are bound to the
+# loop that created them, so sharing one across loops would corrupt both. Weak
+# keys drop the entry with its loop; sync callers (no running loop) share one client.
+_telemetry_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TelemetryClient]" = weakref.WeakKeyDictionary()
+_sync_client: Optional[TelemetryClient] = None
+
 
 def get_telemetry_client() -> TelemetryClient:
-    """Get or create singleton telemetry client"""
-    global _telemetry_client
-    if _telemetry_client is None:
-        _telemetry_client = TelemetryClient()
-    return _telemetry_client
+    """Get or create the telemetry client for the running event loop (process-wide outside a loop)"""
+    global _sync_client
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        if _sync_client is None:
+            _sync_client = TelemetryClient()
+            atexit.register(_sync_client.close)
+        return _sync_client
+
+    client = _telemetry_clients.get(loop)
+    if client is None:
+        client = _telemetry_clients[loop] = TelemetryClient()
+        # Backstop for loops that never await close_telemetry_client(): release
+        # the sync pool once the loop is collected. Captures only the session so
+        # the finalizer itself doesn't pin the client. A started batch flusher
+        # still references the loop, so callers must close the client explicitly.
+        weakref.finalize(loop, client._session.close)
+    return client
+
+
+async def close_telemetry_client() -> None:
+    """Flush and close the running loop's telemetry client (call before the loop shuts down)."""
+    client = _telemetry_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
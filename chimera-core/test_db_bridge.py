@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the db_bridge background insert flusher.
+
+No Postgres needed: the pooled connection and the row writer are replaced
+with in-memory fakes.
+
+Usage:
+    python -m pytest -q test_db_bridge.py
+"""
+import dataclasses
+import sys
+from pathlib import Path
+
+import psycopg2
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import db_bridge
+
+
+class FakeConn:
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def cursor(self):
+        return self
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def flusher(monkeypatch):
+    """Route flush_pending_inserts into a fake DB; returns its state."""
+    state = {"written": [], "down": False, "poison": set()}
+
+    def fake_get_conn():
+        return None if state["down"] else FakeConn()
+
+    def fake_write_rows(cur, table, rows):
+        if state["down"]:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        if any(row[0] in state["poison"] for row in rows):
+            raise psycopg2.DataError("invalid input syntax")
+        state["written"].extend(rows)
+
+    monkeypatch.setattr(db_bridge, "get_db_connection", fake_get_conn)
+    monkeypatch.setattr(db_bridge, "return_db_connection", lambda conn: None)
+    monkeypatch.setattr(db_bridge, "_ensure_schema", lambda conn: None)
+    monkeypatch.setattr(db_bridge, "_write_rows", fake_write_rows)
+    monkeypatch.setattr(db_bridge, "_start_flusher", lambda: None)
+    monkeypatch.setattr(db_bridge, "_retry_delay", 0.0)
+    monkeypatch.setattr(db_bridge, "_retry_at", 0.0)
+    monkeypatch.setattr(db_bridge, "_CFG", dataclasses.replace(
+        db_bridge._CFG, async_inserts=True, queue_max=5
+    ))
+    yield state
+    for table, q in db_bridge._INSERT_QUEUES.items():
+        db_bridge._drain(q, q.qsize())
+        db_bridge._RETRY_ROWS[table].clear()
+
+
+def test_flush_writes_queued_rows(flusher):
+    assert db_bridge._submit_row("mission_results", ("w1",))
+    assert db_bridge._submit_row("mission_results", ("w2",))
+
+    assert db_bridge.flush_pending_inserts() == 2
+    assert flusher["written"] == [("w1",), ("w2",)]
+    assert db_bridge._pending_row_count() == 0
+
+
+def test_outage_keeps_rows_and_backs_off(flusher):
+    db_bridge._submit_row("mission_results", ("w1",))
+    db_bridge._submit_row("mission_results", ("w2",))
+    flusher["down"] = True
+
+    assert db_bridge.flush_pending_inserts() == 0
+    assert db_bridge._pending_row_count() == 2
+    assert db_bridge._retry_delay == db_bridge._RETRY_BACKOFF_MIN_S
+    assert db_bridge._retry_at > 0
+
+    # Still down: backoff doubles, nothing lost
+    db_bridge.flush_pending_inserts()
+    assert db_bridge._retry_delay == 2 * db_bridge._RETRY_BACKOFF_MIN_S
+    assert db_bridge._pending_row_count() == 2
+
+    # Rows queued during the outage are written after the retried ones
+    db_bridge._submit_row("mission_results", ("w3",))
+    flusher["down"] = False
+    assert db_bridge.flush_pending_inserts() == 3
+    assert flusher["written"] == [("w1",), ("w2",), ("w3",)]
+    assert db_bridge._retry_delay == 0.0
+
+
+def test_backlog_full_rejects_new_rows(flusher):
+    flusher["down"] = True
+    for i in range(5):
+        assert db_bridge._submit_row("mission_results", (f"w{i}",))
+    db_bridge.flush_pending_inserts()
+
+    assert not db_bridge._submit_row("mission_results", ("overflow",))
+    assert db_bridge._pending_row_count() == 5
+
+
+def test_poison_row_only_drops_itself(flusher):
+    for worker in ("w1", "bad", "w3"):
+        db_bridge._submit_row("mission_results", (worker,))
+    flusher["poison"].add("bad")
+
+    assert db_bridge.flush_pending_inserts() == 2
+    assert flusher["written"] == [("w1",), ("w3",)]
+    assert db_bridge._pending_row_count() == 0
+
+
+class SessionConn:
+    def __init__(self, **session):
+        self.autocommit = False
+        self.isolation_level = self.readonly = self.deferrable = None
+        self.__dict__.update(session)
+        self.set_session_calls = []
+
+    def set_session(self, **kwargs):
+        self.set_session_calls.append(kwargs)
+
+
+def test_reset_session_restores_defaults_only_when_changed():
+    clean = SessionConn()
+    db_bridge._reset_session(clean)
+    assert clean.set_session_calls == []
+
+    dirty = SessionConn(autocommit=True, readonly=True)
+    db_bridge._reset_session(dirty)
+    assert dirty.set_session_calls == [{
+        "isolation_level": "DEFAULT", "readonly": "DEFAULT", "deferrable": "DEFAULT", "autocommit": False,
+    }]
+
+
+def test_exit_flush_runs_once(flusher, monkeypatch, caplog):
+    monkeypatch.setattr(db_bridge, "_exit_flushed", False)
+    flusher["down"] = True
+    db_bridge._submit_row("mission_results", ("w1",))
+
+    db_bridge._flush_at_exit()
+    db_bridge._flush_at_exit()  # second atexit hook (_close_pool / _start_flusher)
+
+    assert sum("Exiting with 1 unwritten" in r.getMessage() for r in caplog.records) == 1
+
+
+def test_site_map_hits_do_not_share_map_data(monkeypatch):
+    monkeypatch.setattr(db_bridge, "DATABASE_URL", "postgresql://test")
+    url = "https://example.com/test-site-map"
+    db_bridge._site_map_cache.set(url, {
+        "url": url, "structure_hash": "h", "map_data": {"nodes": [{"id": 1}]},
+        "updated_at": None, "updated_at_ts": None,
+    })
+
+    first = db_bridge.get_site_map(url)
+    first["map_data"]["nodes"][0]["id"] = 99
+
+    assert db_bridge.get_site_map(url)["map_data"] == {"nodes": [{"id": 1}]}
+    db_bridge._site_map_cache.pop(url)
@@ -18,6 +18,38 @@ from stealth import DiffusionMouse
 
 logger = logging.getLogger(__name__)
 
+# Trust-score patterns, compiled once (body text is scanned several times per validation)
+_SCORE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+(?:\.\d+)?)\s*%?\s*(?:trust|score|human)',
+    r'(?:trust|score|human)\s*:?\s*(\d+(?:\.\d+)?)\s*%?',
+    r'(\d+(?:\.\d+)?)%',
+))
+# CreepJS typically shows: "Trust Score: 100%" or "100% Human"
+_TRUST_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'trust\s*score[:\s]*(\d+(?:\.\d+)?)\s*%?',
+    r'(\d+(?:\.\d+)?)\s*%\s*(?:trust|human)',
+    r'human[:\s]*(\d+(?:\.\d+)?)\s*%?',
+    r'(\d+(?:\.\d+)?)\s*%',
+))
+# Applied to lowercased text
+_HUMAN_RE = re.compile(r'human[^\d]*(\d+(?:\.\d+)?)')
+
+# Browser-side readiness check polled while waiting for CreepJS to publish a score
+_SCORE_READY_JS = """
+() => window.trustScore !== undefined
+    || (window.creep && (window.creep.trust !== undefined || window.creep.score !== undefined))
+    || /\\d+(?:\\.\\d+)?\\s*%/.test(document.body.innerText)
+"""
+
+
+def _scan_score(text: str, patterns) -> Optional[float]:
+    """Highest score matched by the first pattern that matches anything, else None."""
+    for pattern in patterns:
+        matches = pattern.findall(text)
+        if matches:
+            return max(float(m) for m in matches)
+    return None
+
 
 async def validate_creepjs(page: Page, timeout: int = 30000) -> Dict[str, Any]:
     """
@@ -40,7 +72,9 @@ async def validate_creepjs(page: Page, timeout: int = 30000) -> Dict[str, Any]:
         creepjs_url = "https://abrahamjuliot.github.io/creepjs/"
         logger.info(f"   Navigating to {creepjs_url}...")
         
-        await page.goto(creepjs_url, wait_until="networkidle", timeout=timeout)
+        # domcontentloaded: CreepJS keeps background requests going, so networkidle
+        # can stall for seconds; score readiness is polled before extraction instead
+        await page.goto(creepjs_url, wait_until="domcontentloaded", timeout=timeout)
         
         # CRITICAL: High-Fidelity Active Engagement
         # CreepJS requires biological signatures: diffusion mouse paths + micro-saccade scrolling
@@ -81,7 +115,7 @@ async def validate_creepjs(page: Page, timeout: int = 30000) -> Dict[str, Any]:
         
         # 4. Random hover events over white-space (trigger liveness listeners)
         logger.debug("   Performing curiosity hovers (liveness detection)...")
-        await NaturalReader.curiosity_hover(page, width, height, num_hovers=3)
+        await NaturalReader.curiosity_hover(page, width, height, num_hovers=3, in_page=False)
         
         # 5. CRITICAL: Wait for CreepJS with CONTINUOUS liveness engagement
         # Perform micro-scrolls DURING the wait period to trigger liveness listeners
@@ -114,55 +148,61 @@ async def validate_creepjs(page: Page, timeout: int = 30000) -> Dict[str, Any]:
         is_human = False
         fingerprint_details = {}
         
-        # Wait for CreepJS to finish calculating
+        # Wait for CreepJS to finish calculating (score globals or a percentage on screen)
         try:
-            # Wait for the trust score element to appear
-            await page.wait_for_selector('text=/trust|score|human/i', timeout=10000)
+            await page.wait_for_function(_SCORE_READY_JS, timeout=10000, polling=250)
         except Exception:
-            logger.debug("   Trust score element not found, trying alternative methods")
+            logger.debug("   Trust score not published yet, trying alternative methods")
         
-        # Method 1: Extract from page text content
+        # Method 1: CreepJS globals (canonical source, no text transfer); the
+        # fingerprint details ride along in the same round-trip
         try:
-            # Get all text content
-            page_text = await page.inner_text('body')
-            
-            # Look for percentage patterns
-            score_patterns = [
-                r'(\d+(?:\.\d+)?)\s*%?\s*(?:trust|score|human)',
-                r'(?:trust|score|human)\s*:?\s*(\d+(?:\.\d+)?)\s*%?',
-                r'(\d+(?:\.\d+)?)%',
-            ]
-            
-            for pattern in score_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                if matches:
-                    # Get the highest score found
-                    scores = [float(m) for m in matches if m.replace('.', '').isdigit()]
-                    if scores:
-                        trust_score = max(scores)
-                        is_human = trust_score >= 100.0
-                        break
+            data = await page.evaluate("""
+                () => {
+                    let trust = null;
+                    if (window.creep && window.creep.trust !== undefined) {
+                        trust = { trust: window.creep.trust, source: 'window.creep.trust' };
+                    } else if (window.creep && window.creep.score !== undefined) {
+                        trust = { trust: window.creep.score, source: 'window.creep.score' };
+                    } else if (window.trustScore !== undefined) {
+                        trust = { trust: window.trustScore, source: 'window.trustScore' };
+                    }
+                    const details = {};
+                    if (navigator.webdriver !== undefined) details.webdriver = navigator.webdriver;
+                    if (navigator.platform) details.platform = navigator.platform;
+                    if (navigator.hardwareConcurrency) details.hardwareConcurrency = navigator.hardwareConcurrency;
+                    return { trustData: trust, details: details };
+                }
+            """)
+            fingerprint_details = data.get('details') or {}
+            trust_data = data.get('trustData')
+            if trust_data and trust_data.get('trust') is not None:
+                trust_score = float(trust_data['trust'])
+                is_human = trust_score >= 100.0
+                logger.debug(f"   Extracted trust score from {trust_data.get('source')}: {trust_score}")
         except Exception as e:
-            logger.debug(f"   Could not extract from page text: {e}")
+            logger.debug(f"   Could not extract trust score from JS globals: {e}")
+        
+        # Text fallbacks below share a single fetch of the visible body text
+        page_text = None
+        if trust_score == 0.0:
+            try:
+                page_text = await page.evaluate("() => document.body.innerText")
+            except Exception as e:
+                logger.debug(f"   Could not read page text: {e}")
+        
+        # Method 2: Look for percentage patterns in page text (highest score found)
+        if trust_score == 0.0 and page_text:
+            score = _scan_score(page_text, _SCORE_RES)
+            if score is not None:
+                trust_score = score
+                is_human = trust_score >= 100.0
         
-        # Method 2: Try to extract from JavaScript/DOM
+        # Method 3: Targeted query of trust/score elements
         if trust_score == 0.0:
             try:
-                # CreepJS may store data in various places
                 trust_data = await page.evaluate("""
                     () => {
-                        // Try multiple possible locations
-                        if (window.creep && window.creep.trust !== undefined) {
-                            return { trust: window.creep.trust, source: 'window.creep.trust' };
-                        }
-                        if (window.creep && window.creep.score !== undefined) {
-                            return { trust: window.creep.score, source: 'window.creep.score' };
-                        }
-                        if (window.trustScore !== undefined) {
-                            return { trust: window.trustScore, source: 'window.trustScore' };
-                        }
-                        
-                        // Try to find in DOM
                         const trustElements = document.querySelectorAll('[class*="trust"], [id*="trust"], [class*="score"], [id*="score"]');
                         for (const el of trustElements) {
                             const text = el.textContent || el.innerText;
@@ -171,77 +211,39 @@ async def validate_creepjs(page: Page, timeout: int = 30000) -> Dict[str, Any]:
                                 return { trust: parseFloat(match[1]), source: 'DOM' };
                             }
                         }
-                        
                         return null;
                     }
                 """)
-                
                 if trust_data and trust_data.get('trust') is not None:
                     trust_score = float(trust_data['trust'])
                     is_human = trust_score >= 100.0
                     logger.debug(f"   Extracted trust score from {trust_data.get('source')}: {trust_score}")
             except Exception as e:
-                logger.debug(f"   Could not extract trust score from JS/DOM: {e}")
+                logger.debug(f"   Could not extract trust score from DOM: {e}")
         
-        # Method 3: Extract from visible text (most reliable for CreepJS)
-        if trust_score == 0.0:
-            try:
-                # Get all visible text from the page
-                page_text = await page.evaluate("() => document.body.innerText")
-                
-                # Look for trust score patterns in visible text
-                # CreepJS typically shows: "Trust Score: 100%" or "100% Human"
-                trust_patterns = [
-                    r'trust\s*score[:\s]*(\d+(?:\.\d+)?)\s*%?',
-                    r'(\d+(?:\.\d+)?)\s*%\s*(?:trust|human)',
-                    r'human[:\s]*(\d+(?:\.\d+)?)\s*%?',
-                    r'(\d+(?:\.\d+)?)\s*%',
-                ]
-                
-                for pattern in trust_patterns:
-                    matches = re.findall(pattern, page_text, re.IGNORECASE)
-                    if matches:
-                        scores = [float(m) for m in matches if m.replace('.', '').replace('-', '').isdigit()]
-                        if scores:
-                            trust_score = max(scores)
-                            is_human = trust_score >= 100.0
-                            logger.debug(f"   Extracted from visible text: {trust_score}%")
-                            break
-            except Exception as e:
-                logger.debug(f"   Could not extract from visible text: {e}")
-        
-        # Method 4: Check if page shows "Human" status (assume 100%)
-        if trust_score == 0.0:
-            try:
-                page_text_lower = (await page.inner_text('body')).lower()
-                # If "human" appears prominently, likely 100%
-                if 'human' in page_text_lower:
-                    # Check if there's a percentage nearby
-                    human_context = re.search(r'human[^\d]*(\d+(?:\.\d+)?)', page_text_lower)
-                    if human_context:
-                        trust_score = float(human_context.group(1))
-                        is_human = trust_score >= 100.0
-                    else:
-                        # If "human" appears without percentage, assume 100%
-                        trust_score = 100.0
-                        is_human = True
-                        logger.info("   Detected 'Human' status - assuming 100% trust score")
-            except Exception as e:
-                logger.debug(f"   Could not check for Human status: {e}")
+        # Method 4: Trust score patterns in visible text (CreepJS wording)
+        if trust_score == 0.0 and page_text:
+            score = _scan_score(page_text, _TRUST_RES)
+            if score is not None:
+                trust_score = score
+                is_human = trust_score >= 100.0
+                logger.debug(f"   Extracted from visible text: {trust_score}%")
         
-        # Extract fingerprint details if available
-        try:
-            fingerprint_details = await page.evaluate("""
-                () => {
-                    const details = {};
-                    if (navigator.webdriver !== undefined) details.webdriver = navigator.webdriver;
-                    if (navigator.platform) details.platform = navigator.platform;
-                    if (navigator.hardwareConcurrency) details.hardwareConcurrency = navigator.hardwareConcurrency;
-                    return details;
-                }
-            """)
-        except Exception as e:
-            logger.debug(f"   Could not extract fingerprint details: {e}")
+        # Method 5: Check if page shows "Human" status (assume 100%)
+        if trust_score == 0.0 and page_text:
+            page_text_lower = page_text.lower()
+            # If "human" appears prominently, likely 100%
+            if 'human' in page_text_lower:
+                # Check if there's a percentage nearby
+                human_context = _HUMAN_RE.search(page_text_lower)
+                if human_context:
+                    trust_score = float(human_context.group(1))
+                    is_human = trust_score >= 100.0
+                else:
+                    # If "human" appears without percentage, assume 100%
+                    trust_score = 100.0
+                    is_human = True
+                    logger.info("   Detected 'Human' status - assuming 100% trust score")
         
         # CRITICAL: MUST NOT RETURN until numerical trust score is captured
         # Retry with additional engagement if score not found
@@ -264,29 +266,21 @@ async def validate_creepjs(page: Page, timeout: int = 30000) -> Dict[str, Any]:
             await NaturalReader.micro_scroll_sequence(page, total_distance=200, micro_scrolls=5)
             await asyncio.sleep(2)
             
-            # Wait for score to appear
-            await asyncio.sleep(5)
+            # Wait (up to 5s) for the score to appear instead of a fixed sleep
+            try:
+                await page.wait_for_function(_SCORE_READY_JS, timeout=5000, polling=250)
+            except Exception:
+                logger.debug("   Score not published within 5s, extracting anyway")
             
             # Try extraction again with all methods
             try:
                 # Method: Extract from visible text
                 page_text = await page.evaluate("() => document.body.innerText")
-                trust_patterns = [
-                    r'trust\s*score[:\s]*(\d+(?:\.\d+)?)\s*%?',
-                    r'(\d+(?:\.\d+)?)\s*%\s*(?:trust|human)',
-                    r'human[:\s]*(\d+(?:\.\d+)?)\s*%?',
-                    r'(\d+(?:\.\d+)?)\s*%',
-                ]
-                
-                for pattern in trust_patterns:
-                    matches = re.findall(pattern, page_text, re.IGNORECASE)
-                    if matches:
-                        scores = [float(m) for m in matches if m.replace('.', '').replace('-', '').isdigit()]
-                        if scores:
-                            trust_score = max(scores)
-                            is_human = trust_score >= 100.0
-                            logger.debug(f"   Extracted trust score on retry {retry_count}: {trust_score}%")
-                            break
+                score = _scan_score(page_text, _TRUST_RES)
+                if score is not None:
+                    trust_score = score
+                    is_human = trust_score >= 100.0
+                    logger.debug(f"   Extracted trust score on retry {retry_count}: {trust_score}%")
                 
                 if trust_score and trust_score > 0:
                     break
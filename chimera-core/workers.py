@@ -14,12 +14,13 @@ import json
 import hashlib
 import random
 import re
-from typing import Optional, Dict, Any, Tuple
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 from urllib.parse import urlparse
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 
-from network import get_proxy_config, should_rotate_session_on_403
+from network import get_proxy_config, ROTATE_SESSION_ON_403
 from stealth import (
     get_stealth_launch_args,
     apply_stealth_patches,
@@ -79,6 +80,24 @@ def _get_redis():
         return None
 
 
+# gRPC channel options for the Brain connection. Keepalive stays within the
+# server's default ping policy (>= 5 min, only while calls are active) so a
+# half-dead connection is detected without risking GOAWAY(too_many_pings).
+_BRAIN_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 300000),
+    ("grpc.keepalive_timeout_ms", 20000),
+    ("grpc.keepalive_permit_without_calls", 0),
+]
+
+# Screenshots go to the Brain as raw bytes; JPEG is several times smaller than
+# PNG to encode and ship, and the VLM decodes either. Set SCREENSHOT_FORMAT=png
+# to get lossless captures when debugging grounding.
+SCREENSHOT_FORMAT = (os.getenv("SCREENSHOT_FORMAT") or "jpeg").strip().lower()
+SCREENSHOT_JPEG_QUALITY = int(os.getenv("SCREENSHOT_JPEG_QUALITY", "85"))
+if SCREENSHOT_FORMAT not in ("jpeg", "png"):
+    SCREENSHOT_FORMAT = "jpeg"
+
+
 class PhantomWorker:
     """
     Stealth browser worker that achieves 100% Human trust score on CreepJS.
@@ -129,6 +148,13 @@ class PhantomWorker:
         # 403/Cloudflare: response listener sets this; _check_403_and_rotate performs full session rotation
         self._seen_403 = False
 
+        # Screenshot memo: reused by get_cached_screenshot until navigation/input marks it dirty
+        self._last_shot_bytes: Optional[bytes] = None
+        self._last_shot_monotonic = 0.0
+        self._shot_dirty = True
+        # Semantic grounding memo: (frame hash, description) -> Ground, LRU, cleared on navigation
+        self._ground_cache: "OrderedDict[Tuple[int, str], Any]" = OrderedDict()
+
         logger.info(f"🦾 PhantomWorker {worker_id} initialized")
 
     def next_fatigue_state(self) -> tuple[int, float, float]:
@@ -258,6 +284,10 @@ class PhantomWorker:
                 pass
 
         self._page.on("response", _on_response)
+        # Any navigation changes what's on screen
+        self._last_shot_bytes = None
+        self._ground_cache.clear()
+        self._page.on("framenavigated", lambda _frame: self._on_navigated())
 
     async def rotate_hardware_identity(self, mission_id: str, carrier: Optional[str] = None) -> None:
         """
@@ -339,10 +369,16 @@ class PhantomWorker:
             
             logger.info(f"🧠 Connecting to The Brain at {address}...")
             
-            self._grpc_channel = grpc.aio.insecure_channel(address)
+            # One long-lived, multiplexed HTTP/2 channel per worker for every
+            # ProcessVision call (the gRPC analogue of a keep-alive HTTP session)
+            self._grpc_channel = grpc.aio.insecure_channel(address, options=_BRAIN_CHANNEL_OPTIONS)
             self._brain_client = chimera_pb2_grpc.BrainStub(self._grpc_channel)
             
-            # Test connection with a simple query
+            # Connect eagerly so the first grounding call doesn't absorb the handshake
+            try:
+                await asyncio.wait_for(self._grpc_channel.channel_ready(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ Brain channel not ready yet; will connect on first call")
             logger.info("✅ Connected to The Brain")
             
         except Exception as e:
@@ -461,6 +497,7 @@ class PhantomWorker:
                             steps = random.randint(8, 14)
                             per = bounce / steps
                             # smooth down
+                            self.invalidate_screenshot()
                             for _ in range(steps):
                                 await self._page.mouse.wheel(0, per)
                                 await asyncio.sleep(random.uniform(0.015, 0.035))
@@ -502,9 +539,11 @@ class PhantomWorker:
         Returns:
             True if click succeeded, False otherwise
         """
+        self.invalidate_screenshot()
+
         # Phase 9: Execution entropy (micro-calculations)
         try:
-            inject_execution_noise(tag="safe_click")
+            await inject_execution_noise(tag="safe_click")
         except Exception:
             pass
 
@@ -571,6 +610,7 @@ class PhantomWorker:
                                     familiarity=True,
                                 )
                                 self._mouse_pos = target
+                                self._record_mouse(target)
                         except Exception:
                             pass
 
@@ -682,8 +722,10 @@ class PhantomWorker:
             raise RuntimeError("Page not initialized")
         current = self._mouse_pos
         target = (float(x), float(y))
+        self.invalidate_screenshot()
         await DiffusionMouse.move_to(self._page, target=target, current_pos=current)
         self._mouse_pos = target
+        self._record_mouse(target)
 
     async def _compute_structure_hash(self) -> Optional[str]:
         """
@@ -819,6 +861,7 @@ class PhantomWorker:
 
             await self.move_to(x, y)
             await self._page.mouse.click(x, y)
+            self.invalidate_screenshot()
             logger.info("✅ Visual Attempt click executed")
             return True
         except Exception as e:
@@ -912,12 +955,73 @@ class PhantomWorker:
             logger.error(f"❌ Vision processing failed: {e}")
             return None
     
+    async def process_vision_batch(
+        self,
+        screenshot: bytes,
+        context: str,
+        text_commands: List[str],
+        max_in_flight: Optional[int] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Ground several text commands against one screenshot.
+        The Brain has no batch RPC, so the calls are issued concurrently over the
+        shared gRPC channel (HTTP/2 multiplexed) instead of one after another.
+        max_in_flight caps how many of those calls are outstanding at once.
+        Returns one process_vision result per command, in order.
+        """
+        if not text_commands:
+            return []
+        if not max_in_flight or max_in_flight >= len(text_commands):
+            return list(await asyncio.gather(*[
+                self.process_vision(screenshot, context=context, text_command=cmd)
+                for cmd in text_commands
+            ]))
+
+        sem = asyncio.Semaphore(max_in_flight)
+
+        async def _one(cmd: str) -> Optional[Dict[str, Any]]:
+            async with sem:
+                return await self.process_vision(screenshot, context=context, text_command=cmd)
+
+        return list(await asyncio.gather(*[_one(cmd) for cmd in text_commands]))
+
     async def take_screenshot(self) -> bytes:
         """Take screenshot of current page"""
         if not self._page:
             raise RuntimeError("Page not initialized")
         
-        return await self._page.screenshot(full_page=False)
+        if SCREENSHOT_FORMAT == "png":
+            shot = await self._page.screenshot(type="png", full_page=False)
+        else:
+            shot = await self._page.screenshot(
+                type="jpeg", quality=SCREENSHOT_JPEG_QUALITY, full_page=False
+            )
+        self._last_shot_bytes = shot
+        self._last_shot_monotonic = time.monotonic()
+        self._shot_dirty = False
+        return shot
+
+    async def get_cached_screenshot(self, max_age_ms: float = 250.0) -> bytes:
+        """
+        Return the last screenshot if nothing has changed the page since it was
+        taken and it is younger than max_age_ms; otherwise capture a fresh one.
+        """
+        if (
+            self._last_shot_bytes is not None
+            and not self._shot_dirty
+            and (time.monotonic() - self._last_shot_monotonic) * 1000.0 < max_age_ms
+        ):
+            return self._last_shot_bytes
+        return await self.take_screenshot()
+
+    def invalidate_screenshot(self) -> None:
+        """Mark the cached screenshot stale (navigation, click, scroll, typing)."""
+        self._shot_dirty = True
+
+    def _on_navigated(self) -> None:
+        # New document: neither the frame nor anything grounded on it is reusable
+        self._shot_dirty = True
+        self._ground_cache.clear()
 
     async def execute_mission(self, mission: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1000,6 +1104,8 @@ class PhantomWorker:
             await self._check_403_and_rotate(mission_id, mission.get("carrier"))
             # Gaussian Jitter (FatigueFactor) + Session Decay (missions>20: increase jitter/delays)
             await self._fatigue_delay(step_index=i, mission_count=mission_count)
+            # Every step may change the screen (click/type/goto); don't reuse the previous frame
+            self.invalidate_screenshot()
             action = (step.get("action") or step.get("type") or "").lower().strip()
 
             if action == "goto":
@@ -1106,6 +1212,19 @@ class PhantomWorker:
         d = max(0.02, random.gauss(mu, sigma))
         await asyncio.sleep(d)
 
+    def _record_mouse(self, pos: Tuple[float, float]) -> None:
+        """Feed a deliberate cursor move into the V2 Pilot mouse heatmap (last 10 per mission)."""
+        mid = getattr(self, "_telemetry_mission_id", None)
+        if not mid or not os.getenv("BRAINSCRAPER_URL"):
+            return
+        try:
+            from telemetry_client import get_telemetry_client
+            get_telemetry_client().append_mouse(
+                mid, {"x": pos[0], "y": pos[1], "timestamp": int(time.time() * 1000)}
+            )
+        except Exception:
+            pass
+
     def _emit_telemetry(self, step: str, detail: str) -> None:
         """LPUSH to chimera:telemetry:{mission_id} for Scrapegoat to stream into progress. Root-cause diagnosis: pivot, CAPTCHA, extract. Also log to stdout."""
         mid = getattr(self, "_telemetry_mission_id", None)
@@ -1122,11 +1241,11 @@ class PhantomWorker:
 
     async def _check_403_and_rotate(self, mission_id: str, carrier: Optional[str] = None) -> bool:
         """
-        If a 403 (e.g. Cloudflare block) was seen on a document and should_rotate_session_on_403
+        If a 403 (e.g. Cloudflare block) was seen on a document and ROTATE_SESSION_ON_403
         is True, perform a complete session rotation: new context with new sticky_session_id so
         Decodo assigns a fresh mobile IP. Returns True if rotation was performed.
         """
-        if not self._seen_403 or not should_rotate_session_on_403():
+        if not self._seen_403 or not ROTATE_SESSION_ON_403:
             return False
         new_id = f"{mission_id}_r403_{int(time.time() * 1000)}"
         logger.warning("403/Cloudflare block: rotating session to %s (fresh mobile IP)", new_id)